@@ -1,3 +1,4 @@
-from .api import Redis, Transaction
-from .connection import Connection, Hello, Pool
+from .api import PendingReply, Pipeline, Redis, Transaction
+from .connection import Connection, Hello, Multiplexer, Pool, encode_key
+from .protocol import HiredisReader, Reader
 from .scanner import HSCAN, SCAN, SSCAN, ZSCAN, PairedZSCAN
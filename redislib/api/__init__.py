@@ -1 +1,2 @@
+from .pipeline import PendingReply, Pipeline
 from .redis import Redis, Transaction
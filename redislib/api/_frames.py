@@ -0,0 +1,71 @@
+"""
+prebuilt frame prefixes of the fixed-arity commands, see connection.pack_prefix();
+*_FRAME are whole frames which take no more args
+"""
+
+from ..connection import pack_prebuilt, pack_prefix
+
+# connection
+ECHO_PREFIX = pack_prefix(b"ECHO", 1)
+PING_PREFIX = pack_prefix(b"PING", 0)
+QUIT_PREFIX = pack_prefix(b"QUIT", 0)
+RESET_PREFIX = pack_prefix(b"RESET", 0)
+SELECT_PREFIX = pack_prefix(b"SELECT", 1)
+# whole frames of the common dbs, which go through _send_prebuilt() without args
+SELECT_FRAMES = tuple(pack_prebuilt(SELECT_PREFIX, db) for db in range(16))
+
+# hashes
+HEXISTS_PREFIX = pack_prefix(b"HEXISTS", 2)
+HGET_PREFIX = pack_prefix(b"HGET", 2)
+HGETALL_PREFIX = pack_prefix(b"HGETALL", 1)
+HINCRBY_PREFIX = pack_prefix(b"HINCRBY", 3)
+HKEYS_PREFIX = pack_prefix(b"HKEYS", 1)
+HLEN_PREFIX = pack_prefix(b"HLEN", 1)
+HSETNX_PREFIX = pack_prefix(b"HSETNX", 3)
+HVALS_PREFIX = pack_prefix(b"HVALS", 1)
+
+# keys
+DUMP_PREFIX = pack_prefix(b"DUMP", 1)
+MOVE_PREFIX = pack_prefix(b"MOVE", 2)
+PERSIST_PREFIX = pack_prefix(b"PERSIST", 1)
+RANDOMKEY_PREFIX = pack_prefix(b"RANDOMKEY", 0)
+RENAME_PREFIX = pack_prefix(b"RENAME", 2)
+RENAMENX_PREFIX = pack_prefix(b"RENAMENX", 2)
+TTL_PREFIX = pack_prefix(b"TTL", 1)
+TYPE_PREFIX = pack_prefix(b"TYPE", 1)
+
+# lists
+LLEN_PREFIX = pack_prefix(b"LLEN", 1)
+LPOP_PREFIX = pack_prefix(b"LPOP", 2)
+LRANGE_PREFIX = pack_prefix(b"LRANGE", 3)
+LTRIM_PREFIX = pack_prefix(b"LTRIM", 3)
+
+# server
+BGREWRITEAOF_PREFIX = pack_prefix(b"BGREWRITEAOF", 0)
+BGSAVE_PREFIX = pack_prefix(b"BGSAVE", 0)
+LASTSAVE_PREFIX = pack_prefix(b"LASTSAVE", 0)
+ROLE_PREFIX = pack_prefix(b"ROLE", 0)
+TIME_PREFIX = pack_prefix(b"TIME", 0)
+LATENCY_DOCTOR_FRAME = pack_prebuilt(pack_prefix(b"LATENCY", 1), b"DOCTOR")
+MEMORY_DOCTOR_FRAME = pack_prebuilt(pack_prefix(b"MEMORY", 1), b"DOCTOR")
+
+# strings
+DECR_PREFIX = pack_prefix(b"DECR", 1)
+DECRBY_PREFIX = pack_prefix(b"DECRBY", 2)
+GET_PREFIX = pack_prefix(b"GET", 1)
+GETDEL_PREFIX = pack_prefix(b"GETDEL", 1)
+INCR_PREFIX = pack_prefix(b"INCR", 1)
+INCRBY_PREFIX = pack_prefix(b"INCRBY", 2)
+SET_PREFIX = pack_prefix(b"SET", 2)
+SETNX_PREFIX = pack_prefix(b"SETNX", 2)
+
+# transactions
+DISCARD_PREFIX = pack_prefix(b"DISCARD", 0)
+EXEC_PREFIX = pack_prefix(b"EXEC", 0)
+MULTI_PREFIX = pack_prefix(b"MULTI", 0)
+UNWATCH_PREFIX = pack_prefix(b"UNWATCH", 0)
+
+# zsets
+ZCARD_PREFIX = pack_prefix(b"ZCARD", 1)
+ZRANK_PREFIX = pack_prefix(b"ZRANK", 2)
+ZSCORE_PREFIX = pack_prefix(b"ZSCORE", 2)
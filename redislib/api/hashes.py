@@ -1,9 +1,31 @@
-from ..typing import RoundTrip, String
+from ..connection import encode_key
+from ..typing import Arg, RoundTrip, String
+from ._frames import (
+    HEXISTS_PREFIX,
+    HGET_PREFIX,
+    HGETALL_PREFIX,
+    HINCRBY_PREFIX,
+    HKEYS_PREFIX,
+    HLEN_PREFIX,
+    HSETNX_PREFIX,
+    HVALS_PREFIX,
+)
+from .scripting import Script, run_script
+
+_HSET_EX = Script(
+    b"""
+local n = redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return n
+"""
+)
 
 
 class HashesMixin(RoundTrip):
     """https://redis.io/commands#hash"""
 
+    __slots__ = ()
+
     async def hdel(self, key: String, *fields: String) -> int:
         """
         :return: number of successful deletion
@@ -20,22 +42,30 @@ class HashesMixin(RoundTrip):
 
         Returns if field is an existing field in the hash stored at key."""
 
-        return await self._round_trip(b"HEXISTS", key, field)
+        return await self._send_prebuilt(HEXISTS_PREFIX, key, field)
 
     async def hget(self, key: String, field: String) -> bytes:
         """Returns the value associated with field in the hash stored at key."""
 
-        return await self._round_trip(b"HGET", key, field)
+        return await self._send_prebuilt(HGET_PREFIX, key, field)
 
     async def hgetall(self, key: String) -> dict[bytes, bytes]:
         """
-        :return: {field: value}
+        :return: {field: value}, field in bytes; a repeated field is there
+            once, as dict keys are unique
 
         Returns all fields and values of the hash stored at key. In the
         returned value, every field name is followed by its value, so the
         length of the reply is twice the size of the hash."""
 
-        return await self._round_trip(b"HGETALL", key)
+        reply = await self._send_prebuilt(HGETALL_PREFIX, key)
+
+        # a map in resp3, but a flat array of field and value in resp2
+        if isinstance(reply, list):
+            it = iter(reply)
+            return dict(zip(it, it))
+
+        return reply
 
     async def hincrby(self, key: String, field: String, increment: int) -> int:
         """
@@ -50,21 +80,22 @@ class HashesMixin(RoundTrip):
         The range of values supported by HINCRBY is limited to 64 bit signed
         integers."""
 
-        return await self._round_trip(b"HINCRBY", key, field, increment)
+        return await self._send_prebuilt(HINCRBY_PREFIX, key, field, increment)
 
     async def hkeys(self, key: String) -> list[bytes]:
         """Returns all field names in the hash stored at key."""
 
-        return await self._round_trip(b"HKEYS", key)
+        return await self._send_prebuilt(HKEYS_PREFIX, key)
 
     async def hlen(self, key: String) -> int:
         """Returns the number of fields contained in the hash stored at key."""
 
-        return await self._round_trip(b"HLEN", key)
+        return await self._send_prebuilt(HLEN_PREFIX, key)
 
     async def hmget(self, key: String, *fields: String) -> dict[bytes, bytes]:
         """
-        :return: {field: value}
+        :return: {field: value}, field in bytes; a repeated field is there
+            once, as dict keys are unique
 
         Returns the values associated with the specified fields in the hash
         stored at key.
@@ -74,7 +105,14 @@ class HashesMixin(RoundTrip):
         running HMGET against a non-existing key will return a list of nil
         values."""
 
-        return await self._round_trip(b"HMGET", key, *fields)
+        reply = await self._round_trip(b"HMGET", key, *fields)
+
+        # an error, or a PendingReply of pipeline
+        if not isinstance(reply, list):
+            return reply
+
+        # pairing with the given fields saves redis from sending them back
+        return dict(zip(map(encode_key, fields), reply))
 
     async def hset(self, key: String, *field_value: tuple[str, str]) -> int:
         """
@@ -85,14 +123,30 @@ class HashesMixin(RoundTrip):
         exist, a new key holding a hash is created. If field already exists in
         the hash, it is overwritten."""
 
-        def _args():
-            yield key
+        args = [key]
+
+        for field, value in field_value:
+            args.append(field)
+            args.append(value)
 
-            for field, value in field_value:
-                yield field
-                yield value
+        return await self._round_trip(b"HSET", *args)
 
-        return await self._round_trip(b"HSET", *_args())
+    async def hset_ex(
+        self, key: String, ttl: int, *field_value: tuple[str, str]
+    ) -> int:
+        """
+        :param ttl: in seconds
+        :return: number of successful set
+
+        HSET then EXPIRE in one round trip, by a cached lua script"""
+
+        args: list[Arg] = [ttl]
+
+        for field, value in field_value:
+            args.append(field)
+            args.append(value)
+
+        return await run_script(self, _HSET_EX, (key,), tuple(args))
 
     async def hrandfield(
         self, key: String, count: int = None, withvalues: bool = False
@@ -100,28 +154,18 @@ class HashesMixin(RoundTrip):
         """When called with just the key argument, return a random field from
         the hash value stored at key.
 
-        If the provided count argument is positive, return an array of
-        distinct fields. The array's length is either count or the hash's
-        number of fields (HLEN), whichever is lower.
-
-        If called with a negative count, the behavior changes and the command
-        is allowed to return the same field multiple times. In this case, the
-        number of returned fields is the absolute value of the specified
-        count.
-
-        The optional WITHVALUES modifier changes the reply so it includes the
-        respective values of the randomly selected hash fields."""
+        see https://redis.io/commands/hrandfield
+        """
 
-        def _args():
-            yield key
+        args = [key]
 
-            if count is not None:
-                yield count
+        if count is not None:
+            args.append(count)
 
-            if withvalues:
-                yield "WITHVALUES"
+        if withvalues:
+            args.append(b"WITHVALUES")
 
-        return await self._round_trip(b"HRANDFIELD", *_args())
+        return await self._round_trip(b"HRANDFIELD", *args)
 
     async def hscan(
         self, key: String, cursor: int, pattern: String = None, count: int = None
@@ -130,18 +174,16 @@ class HashesMixin(RoundTrip):
         :return: (cursor, [field])
         """
 
-        def _args():
-            yield key
-            yield cursor
+        args = [key, cursor]
 
-            if pattern:
-                yield "MATCH"
-                yield pattern
-            if count is not None:
-                yield "COUNT"
-                yield count
+        if pattern:
+            args.append(b"MATCH")
+            args.append(pattern)
+        if count is not None:
+            args.append(b"COUNT")
+            args.append(count)
 
-        return await self._round_trip(b"HSCAN", *_args())
+        return await self._round_trip(b"HSCAN", *args)
 
     async def hsetnx(self, key: String, field: String, value: String) -> int:
         """
@@ -151,9 +193,9 @@ class HashesMixin(RoundTrip):
         not yet exist. If key does not exist, a new key holding a hash is
         created. If field already exists, this operation has no effect."""
 
-        return await self._round_trip(b"HSETNX", key, field, value)
+        return await self._send_prebuilt(HSETNX_PREFIX, key, field, value)
 
     async def hvals(self, key: String) -> list[bytes]:
         """Returns all values in the hash stored at key."""
 
-        return await self._round_trip(b"HVALS", key)
+        return await self._send_prebuilt(HVALS_PREFIX, key)
@@ -1,9 +1,21 @@
 from typing import Optional
 
 from ..typing import RoundTrip, String
+from ._frames import (
+    DUMP_PREFIX,
+    MOVE_PREFIX,
+    PERSIST_PREFIX,
+    RANDOMKEY_PREFIX,
+    RENAME_PREFIX,
+    RENAMENX_PREFIX,
+    TTL_PREFIX,
+    TYPE_PREFIX,
+)
 
 
 class KeysMixin(RoundTrip):
+    __slots__ = ()
+
     async def copy(
         self,
         source: String,
@@ -25,17 +37,15 @@ class KeysMixin(RoundTrip):
         The REPLACE option removes the destination key before copying the
         value to it."""
 
-        def _args():
-            yield source
-            yield dest
+        args = [source, dest]
 
-            if dest_db is not None:
-                yield "DB"
-                yield dest_db
-            if replace:
-                yield "REPLACE"
+        if dest_db is not None:
+            args.append(b"DB")
+            args.append(dest_db)
+        if replace:
+            args.append(b"REPLACE")
 
-        return await self._round_trip(b"COPY", *_args())
+        return await self._round_trip(b"COPY", *args)
 
     async def del_(self, *keys: String) -> int:
         """
@@ -43,29 +53,19 @@ class KeysMixin(RoundTrip):
 
         Removes the specified keys. A key is ignored if it does not exist."""
 
-        return await self._round_trip(b"DEL", *keys)
+        return await self._round_trip_seq(b"DEL", keys)
 
     async def dump(self, key: String) -> bytes:
         """Serialize the value stored at key in a Redis-specific format and
         return it to the user. The returned value can be synthesized back into
         a Redis key using the RESTORE command.
 
-        The serialization format is opaque and non-standard, however it has
-        a few semantic characteristics:
-
-        It contains a 64-bit checksum that is used to make sure errors will be
-        detected. The RESTORE command makes sure to check the checksum before
-        synthesizing a key using the serialized value. Values are encoded in
-        the same format used by RDB. An RDB version is encoded inside the
-        serialized value, so that different Redis versions with incompatible
-        RDB formats will refuse to process the serialized value. The
-        serialized value does NOT contain expire information. In order to
-        capture the time to live of the current value the PTTL command should
-        be used.
+        If key does not exist a nil bulk reply is returned.
 
-        If key does not exist a nil bulk reply is returned."""
+        see https://redis.io/commands/dump
+        """
 
-        return await self._round_trip(b"DUMP", key)
+        return await self._send_prebuilt(DUMP_PREFIX, key)
 
     async def exists(self, *keys: String) -> int:
         """
@@ -75,7 +75,7 @@ class KeysMixin(RoundTrip):
         the arguments multiple times, it will be counted multiple times. So if
         somekey exists, EXISTS somekey somekey will return 2.
         """
-        return await self._round_trip(b"EXISTS", *keys)
+        return await self._round_trip_seq(b"EXISTS", keys)
 
     async def expire(
         self,
@@ -93,73 +93,27 @@ class KeysMixin(RoundTrip):
         automatically be deleted. A key with an associated timeout is often
         said to be volatile in Redis terminology.
 
-        The timeout will only be cleared by commands that delete or overwrite
-        the contents of the key, including DEL, SET, GETSET and all the *STORE
-        commands. This means that all the operations that conceptually alter
-        the value stored at the key without replacing it with a new one will
-        leave the timeout untouched. For instance, incrementing the value of
-        a key with INCR, pushing a new value into a list with LPUSH, or
-        altering the field value of a hash with HSET are all operations that
-        will leave the timeout untouched.
-
-        The timeout can also be cleared, turning the key back into
-        a persistent key, using the PERSIST command.
-
-        If a key is renamed with RENAME, the associated time to live is
-        transferred to the new key name.
-
-        If a key is overwritten by RENAME, like in the case of an existing key
-        Key_A that is overwritten by a call like RENAME Key_B Key_A, it does
-        not matter if the original Key_A had a timeout associated or not, the
-        new key Key_A will inherit all the characteristics of Key_B.
-
-        Note that calling EXPIRE/PEXPIRE with a non-positive timeout or
-        EXPIREAT/PEXPIREAT with a time in the past will result in the key
-        being deleted rather than expired (accordingly, the emitted key event
-                will be del, not expired).
-
-        Options
+        The GT, LT and NX options are mutually exclusive; a non-volatile key
+        is treated as an infinite TTL for the purpose of GT and LT.
 
-        The EXPIRE command supports a set of options:
-        * NX -- Set expiry only when the key has no expiry
-        * XX -- Set expiry only when the key has an existing expiry
-        * GT -- Set expiry only when the new expiry is greater than current one
-        * LT -- Set expiry only when the new expiry is less than current one
-
-        A non-volatile key is treated as an infinite TTL for the purpose of GT
-        and LT. The GT, LT and NX options are mutually exclusive.
-
-        Refreshing expires
-
-        It is possible to call EXPIRE using as argument a key that already has
-        an existing expire set. In this case the time to live of a key is
-        updated to the new value. There are many useful applications for this,
-        an example is documented in the Navigation session pattern section
-        below.
-
-        Differences in Redis prior 2.1.3
-
-        In Redis versions prior 2.1.3 altering a key with an expire set using
-        a command altering its value had the effect of removing the key
-        entirely. This semantics was needed because of limitations in the
-        replication layer that are now fixed.
+        see https://redis.io/commands/expire
+        """
 
-        EXPIRE would return 0 and not alter the timeout for a key with a timeout set."""
+        if not (nx or xx or gt or lt):
+            return await self._round_trip(b"EXPIRE", key, seconds)
 
-        def _args():
-            yield key
-            yield seconds
+        args = [key, seconds]
 
-            if nx:
-                yield "NX"
-            if xx:
-                yield "XX"
-            if gt:
-                yield "gt"
-            if lt:
-                yield "lt"
+        if nx:
+            args.append(b"NX")
+        if xx:
+            args.append(b"XX")
+        if gt:
+            args.append(b"GT")
+        if lt:
+            args.append(b"LT")
 
-        return await self._round_trip(b"EXPIRE", *_args())
+        return await self._round_trip(b"EXPIRE", *args)
 
     async def expireat(
         self,
@@ -178,20 +132,21 @@ class KeysMixin(RoundTrip):
         it takes an absolute Unix timestamp (seconds since January 1, 1970).
         A timestamp in the past will delete the key immediately."""
 
-        def _args():
-            yield key
-            yield timestamp
+        if not (nx or xx or gt or lt):
+            return await self._round_trip(b"EXPIREAT", key, timestamp)
+
+        args = [key, timestamp]
 
-            if nx:
-                yield "NX"
-            if xx:
-                yield "XX"
-            if gt:
-                yield "gt"
-            if lt:
-                yield "lt"
+        if nx:
+            args.append(b"NX")
+        if xx:
+            args.append(b"XX")
+        if gt:
+            args.append(b"GT")
+        if lt:
+            args.append(b"LT")
 
-        return await self._round_trip(b"EXPIREAT", *_args())
+        return await self._round_trip(b"EXPIREAT", *args)
 
     async def move(self, key: String, db: int) -> int:
         """
@@ -203,7 +158,7 @@ class KeysMixin(RoundTrip):
         does nothing. It is possible to use MOVE as a locking primitive
         because of this."""
 
-        return await self._round_trip(b"MOVE", key, db)
+        return await self._send_prebuilt(MOVE_PREFIX, key, db)
 
     async def persist(self, key) -> int:
         """
@@ -213,12 +168,12 @@ class KeysMixin(RoundTrip):
         (a key with an expire set) to persistent (a key that will never expire
                 as no timeout is associated)."""
 
-        return await self._round_trip(b"PERSIST", key)
+        return await self._send_prebuilt(PERSIST_PREFIX, key)
 
     async def randomkey(self) -> Optional[bytes]:
         """Return a random key from the currently selected database."""
 
-        return await self._round_trip(b"RANDOMKEY")
+        return await self._send_prebuilt(RANDOMKEY_PREFIX)
 
     async def rename(self, key: String, newkey: String) -> bytes:
         """
@@ -235,7 +190,7 @@ class KeysMixin(RoundTrip):
         meaning that in practice only keys that have the same hash tag can be
         reliably renamed in cluster."""
 
-        return await self._round_trip(b"RENAME", key, newkey)
+        return await self._send_prebuilt(RENAME_PREFIX, key, newkey)
 
     async def renamenx(self, key: String, newkey: String) -> int:
         """
@@ -248,7 +203,7 @@ class KeysMixin(RoundTrip):
         meaning that in practice only keys that have the same hash tag can be
         reliably renamed in cluster."""
 
-        return await self._round_trip(b"RENAMENX", key, newkey)
+        return await self._send_prebuilt(RENAMENX_PREFIX, key, newkey)
 
     async def scan(
         self,
@@ -263,20 +218,19 @@ class KeysMixin(RoundTrip):
         see api.Scanner
         """
 
-        def _args():
-            yield cursor
+        args = [cursor]
 
-            if pattern:
-                yield "MATCH"
-                yield pattern
-            if count is not None:
-                yield "COUNT"
-                yield count
-            if type is not None:
-                yield "TYPE"
-                yield type
+        if pattern:
+            args.append(b"MATCH")
+            args.append(pattern)
+        if count is not None:
+            args.append(b"COUNT")
+            args.append(count)
+        if type is not None:
+            args.append(b"TYPE")
+            args.append(type)
 
-        return await self._round_trip(b"SCAN", *_args())
+        return await self._round_trip(b"SCAN", *args)
 
     async def ttl(self, key: String):
         """Returns the remaining time to live of a key that has a timeout.
@@ -290,14 +244,14 @@ class KeysMixin(RoundTrip):
         * The command returns -2 if the key does not exist.
         * The command returns -1 if the key exists but has no associated expire."""
 
-        return await self._round_trip(b"TTL", key)
+        return await self._send_prebuilt(TTL_PREFIX, key)
 
     async def type(self, key: String):
         """Returns the string representation of the type of the value stored
         at key. The different types that can be returned are: Stringing, list,
         set, zset, hash and stream."""
 
-        return await self._round_trip(b"TYPE", key)
+        return await self._send_prebuilt(TYPE_PREFIX, key)
 
     async def unlink(self, *keys: String):
         """This command is very similar to DEL: it removes the specified keys.
@@ -1,21 +1,35 @@
 from typing import Literal
 
 from ..typing import RoundTrip, String
+from ._frames import LLEN_PREFIX, LPOP_PREFIX, LRANGE_PREFIX, LTRIM_PREFIX
+
+# (source_left, source_right, destination_left, destination_right): (wherefrom, whereto)
+_LMOVE_ENDS = {
+    (True, None, True, None): (b"LEFT", b"LEFT"),
+    (True, None, None, True): (b"LEFT", b"RIGHT"),
+    (None, True, True, None): (b"RIGHT", b"LEFT"),
+    (None, True, None, True): (b"RIGHT", b"RIGHT"),
+}
 
 
 class ListsMixin(RoundTrip):
     """
     left -> right: first -> last
+
+    methods hand out the awaitable of _round_trip() rather than awaiting it
+    in a coroutine of their own
     """
 
-    async def llen(self, key: String):
+    __slots__ = ()
+
+    def llen(self, key: String):
         """Returns the length of the list stored at key.
         If key does not exist, it is interpreted as an empty list and 0 is returned.
         An error is returned when the value stored at key is not a list.
         """
-        return await self._round_trip(b"LLEN", key)
+        return self._send_prebuilt(LLEN_PREFIX, key)
 
-    async def lpush(self, key: String, *elements: String):
+    def lpush(self, key: String, *elements: String):
         """Insert all the specified values at the head of the list stored at key.
         If key does not exist, it is created as empty list before performing
         the push operations. When key holds a value that is not a list, an
@@ -27,9 +41,13 @@ class ListsMixin(RoundTrip):
         leftmost element to the rightmost element. So for instance the command
         LPUSH mylist a b c will result into a list containing c as first
         element, b as second element and a as third element."""
-        return await self._round_trip(b"LPUSH", key, *elements)
+        return self._round_trip(b"LPUSH", key, *elements)
 
-    async def lpop(self, key: String, n: int = 1):
+    def lpush1(self, key: String, element: String):
+        """lpush() of exactly one element, without packing varargs"""
+        return self._round_trip(b"LPUSH", key, element)
+
+    def lpop(self, key: String, n: int = 1):
         """
         Removes and returns the first elements of the list stored at key.
         By default, the command pops a single element from the beginning of the list. When provided with the optional count argument, the reply will consist of up to count elements, depending on the list's length.
@@ -40,9 +58,9 @@ class ListsMixin(RoundTrip):
         When called with the count argument:
             Array reply: list of popped elements, or nil when key does not exist.
         """
-        return await self._round_trip(b"LPOP", key, n)
+        return self._send_prebuilt(LPOP_PREFIX, key, n)
 
-    async def rpush(self, key: String, *elements: String):
+    def rpush(self, key: String, *elements: String):
         """Insert all the specified values at the tail of the list stored at
         key. If key does not exist, it is created as empty list before
         performing the push operation. When key holds a value that is not
@@ -54,9 +72,13 @@ class ListsMixin(RoundTrip):
         rightmost element. So for instance the command RPUSH mylist a b c will result
         into a list containing a as first element, b as second element and c as third
         element."""
-        return await self._round_trip(b"RPUSH", key, *elements)
+        return self._round_trip(b"RPUSH", key, *elements)
+
+    def rpush1(self, key: String, element: String):
+        """rpush() of exactly one element, without packing varargs"""
+        return self._round_trip(b"RPUSH", key, element)
 
-    async def rpop(self, key: String, n: int = None):
+    def rpop(self, key: String, n: int = None):
         """
         Removes and returns the last elements of the list stored at key.
         By default, the command pops a single element from the end of the list. When provided with the optional count argument, the reply will consist of up to count elements, depending on the list's length.
@@ -68,15 +90,12 @@ class ListsMixin(RoundTrip):
             Array reply: list of popped elements, or nil when key does not exist.
         """
 
-        def _args():
-            yield key
+        if n is None:
+            return self._round_trip(b"RPOP", key)
 
-            if n is not None:
-                yield n
+        return self._round_trip(b"RPOP", key, n)
 
-        return await self._round_trip(b"RPOP", *_args())
-
-    async def lrange(self, key: str, start: int, stop: int):
+    def lrange(self, key: str, start: int, stop: int):
         """Returns the specified elements of the list stored at key. The
         offsets start and stop are zero-based indexes, with 0 being the first
         element of the list (the head of the list), 1 being the next element
@@ -101,9 +120,9 @@ class ListsMixin(RoundTrip):
         than the actual end of the list, Redis will treat it like the last
         element of the list."""
 
-        return await self._round_trip(b"LRANGE", key, start, stop)
+        return self._send_prebuilt(LRANGE_PREFIX, key, start, stop)
 
-    async def ltrim(self, key: str, start: int, stop: int):
+    def ltrim(self, key: str, start: int, stop: int):
         """Trim an existing list so that it will contain only the specified
         range of elements specified. Both start and stop are zero-based
         indexes, where 0 is the first element of the list (the head), 1 the
@@ -132,9 +151,9 @@ class ListsMixin(RoundTrip):
         operation because in the average case just one element is removed from
         the tail of the list."""
 
-        return await self._round_trip(b"LTRIM", key, start, stop)
+        return self._send_prebuilt(LTRIM_PREFIX, key, start, stop)
 
-    async def lmove(
+    def lmove(
         self,
         source: str,
         destination: str,
@@ -161,26 +180,14 @@ class ListsMixin(RoundTrip):
         This command comes in place of the now deprecated RPOPLPUSH. Doing
         LMOVE RIGHT LEFT is equivalent."""
 
-        no_source_ends = not (source_left or source_right)
-        has_dest_ends = destination_left or destination_right
-        if no_source_ends and has_dest_ends:
+        # invalid combinations are not in the table, only they pay for a check
+        try:
+            wherefrom, whereto = _LMOVE_ENDS[
+                source_left, source_right, destination_left, destination_right
+            ]
+        except KeyError:
             raise ValueError(
-                "as destination end is given, source end should be given also"
-            )
-
-        def _args():
-            yield source
-            yield destination
-
-            if source_left:
-                yield "LEFT"
-            if source_right:
-                yield "RIGHT"
-
-            if destination_left:
-                yield "LEFT"
-            if destination_right:
-                yield "RIGHT"
+                "exactly one end of source and one of destination should be given"
+            ) from None
 
-        # TODO@haoliang fixme
-        return await self._round_trip(b"LMOVE", *_args())
+        return self._round_trip(b"LMOVE", source, destination, wherefrom, whereto)
@@ -0,0 +1,127 @@
+from typing import Sequence
+
+import attrs
+
+from ..connection import Connection, pack_cmd, pack_cmd_seq, pack_prebuilt
+from ..typing import Arg, Cmd
+from ._frames import EXEC_PREFIX, MULTI_PREFIX
+from .connection import ConnectionMixin
+from .hashes import HashesMixin
+from .keys import KeysMixin
+from .lists import ListsMixin
+from .scripting import ScriptingMixin
+from .server import ServerMixin
+from .strings import StringsMixin
+from .transactions import TransactionsMixin
+from .zsets import ZsetsMixin
+
+
+@attrs.define
+class PendingReply:
+    """reply of a pipelined command, which is available after execute()"""
+
+    done: bool = False
+    value: object = None
+
+
+@attrs.define(weakref_slot=False, eq=False)
+class Pipeline(
+    KeysMixin,
+    StringsMixin,
+    ListsMixin,
+    ZsetsMixin,
+    ConnectionMixin,
+    ServerMixin,
+    HashesMixin,
+    ScriptingMixin,
+    TransactionsMixin,
+):
+    """
+    commands will be packed and buffered, rather than being sent immediately;
+    execute() sends them in one write, then returns all the replies in order.
+
+    so awaiting a command returns a PendingReply, whose value is set by
+    execute() which returns all the replies as well.
+
+    multi() and exec() are buffered like any other command, so a few
+    transactions can share one write; the replies of the commands in between
+    are QUEUED, and their results are in the reply of exec().
+    """
+
+    _conn: Connection
+    _transaction: bool = False
+    """ wrap the commands in MULTI/EXEC when execute() """
+
+    _packed: list[bytes] = attrs.field(init=False, factory=list)
+    _pending: list[PendingReply] = attrs.field(init=False, factory=list)
+
+    async def _round_trip(self, cmd: Cmd, *args: Arg):
+        return self.queue(cmd, *args)
+
+    async def _round_trip_seq(self, cmd: Cmd, args: Sequence[Arg]):
+        return self._push(pack_cmd_seq(cmd, args))
+
+    async def _send_prebuilt(self, prefix: bytes, *args: Arg):
+        return self._push(pack_prebuilt(prefix, *args))
+
+    def queue(self, cmd: Cmd, *args: Arg) -> PendingReply:
+        """
+        buffer a command without making a coroutine, for big batches
+
+        eg. pipe.queue(b"HGET", key, field)
+        """
+        return self._push(pack_cmd(cmd, *args))
+
+    def _push(self, packed: bytes) -> PendingReply:
+        self._packed.append(packed)
+        pending = PendingReply()
+        self._pending.append(pending)
+        return pending
+
+    async def execute(self) -> list:
+        """
+        :return: [reply], a reply can be a respy3.RedisError
+        """
+        packed, self._packed = self._packed, []
+        pending, self._pending = self._pending, []
+
+        if not packed:
+            return []
+
+        if self._transaction:
+            replies = await self._execute_transaction(packed)
+        else:
+            replies = await self._conn.round_trip_many(packed)
+
+        for reply, pend in zip(replies, pending):
+            pend.done = True
+            pend.value = reply
+
+        return replies
+
+    async def _execute_transaction(self, packed: list[bytes]):
+        """
+        :return: [reply] of EXEC, or EXEC's error/None in place of every reply
+        """
+        replies = await self._conn.round_trip_many(
+            [MULTI_PREFIX, *packed, EXEC_PREFIX]
+        )
+
+        # replies of MULTI and the queued commands are OK and QUEUED, or the
+        # errors which abort the transaction; the last one is of EXEC
+        result = replies[-1]
+
+        if isinstance(result, list):
+            return result
+
+        # EXECABORT, or None as a watched key has been changed
+        return [result] * len(packed)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exctype, exc, tb):
+        if exc is None and self._packed:
+            raise RuntimeError("unexecuted commands left in pipeline")
+
+        self._conn = None
@@ -1,15 +1,30 @@
 import logging
 from contextlib import asynccontextmanager
+from itertools import chain
+from typing import Awaitable, Callable, Sequence
 
 import attrs
-from respy3 import Resp3Reader
+import trio
+from trio.abc import HalfCloseableStream
 
-from ..connection import Connection, Hello, Pool
-from ..typing import Arg, Cmd
+from ..connection import (
+    Connection,
+    Hello,
+    Multiplexer,
+    Pool,
+    pack_cmd,
+    pack_cmd_seq,
+    pack_prebuilt,
+)
+from ..protocol import Reader
+from ..typing import Arg, Cmd, String
+from ._frames import DISCARD_PREFIX, EXEC_PREFIX
 from .connection import ConnectionMixin
 from .hashes import HashesMixin
 from .keys import KeysMixin
 from .lists import ListsMixin
+from .pipeline import PendingReply, Pipeline
+from .scripting import ScriptingMixin
 from .server import ServerMixin
 from .strings import StringsMixin
 from .transactions import TransactionsMixin
@@ -18,7 +33,7 @@ from .zsets import ZsetsMixin
 _log = logging.getLogger(__name__)
 
 
-@attrs.define
+@attrs.define(weakref_slot=False, eq=False)
 class Redis(
     KeysMixin,
     StringsMixin,
@@ -27,36 +42,207 @@ class Redis(
     ConnectionMixin,
     ServerMixin,
     HashesMixin,
+    ScriptingMixin,
 ):
     _pool: Pool
-    _protocol: Resp3Reader = attrs.field(init=False, factory=Resp3Reader)
+    _mux: Multiplexer = attrs.field(default=None)
+    """ when given, commands out of transaction/pipeline share its connection """
+    _conn: Connection = attrs.field(default=None)
+    """ when given, commands use it without touching the pool; see connection() """
 
     async def _round_trip(self, cmd: Cmd, *args: Arg):
+        return await self._round_trip_packed(pack_cmd(cmd, *args))
+
+    async def _round_trip_seq(self, cmd: Cmd, args: Sequence[Arg]):
+        return await self._round_trip_packed(pack_cmd_seq(cmd, args))
+
+    async def _send_prebuilt(self, prefix: bytes, *args: Arg):
+        return await self._round_trip_packed(pack_prebuilt(prefix, *args))
+
+    async def _send_noreply(self, cmd: Cmd, *args: Arg):
+        return await self._round_trip_packed(pack_cmd(cmd, *args), noreply=True)
+
+    async def _round_trip_packed(self, packed: bytes, noreply: bool = False):
+        """send a frame by the bound conn, the mux, or a conn of the pool"""
+        conn = self._conn
+
+        if conn is not None:
+            if noreply:
+                return await conn.send_noreply(packed)
+            return await conn.round_trip_packed(packed)
+
+        if self._mux is not None:
+            # the replies of mux are paired with the calls in order, so
+            # noreply does not apply
+            return await self._mux.round_trip_packed(packed)
+
         async with self._pool.acquire_then_release() as conn:
-            return await conn.round_trip(cmd, *args)
+            if noreply:
+                return await conn.send_noreply(packed)
+            return await conn.round_trip_packed(packed)
 
     async def __aenter__(self):
+        if self._mux is not None:
+            await self._mux.__aenter__()
+
         return self
 
     async def __aexit__(self, exctype, exc, tb):
-        await self._pool.aclose()
+        try:
+            if self._mux is not None:
+                await self._mux.aclose()
+        finally:
+            await self._pool.aclose()
 
     @asynccontextmanager
-    async def open_transaction(self):
+    async def open_transaction(self, buffered: bool = False):
         """
         since Transaction can be used multi times, there is no need to multi() in here.
         just let users do what they want.
+
+        :param buffered: see Transaction
         """
+        # the conn is discarded if the block raises, not to leave it in
+        # MULTI to its next user
         async with self._pool.acquire_then_release() as conn:
-            with Transaction(conn) as tx:
+            with Transaction(conn, buffered) as tx:
                 yield tx
 
+    @asynccontextmanager
+    async def connection(self):
+        """
+        acquire a connection once for a burst of serial commands, rather
+        than acquire and release it for every command.
+
+        async with redis.connection() as rds:
+            for key in keys:
+                await rds.incr(key)
+
+        the yielded Redis should not be shared between concurrent tasks.
+        """
+        async with self._pool.acquire_then_release() as conn:
+            yield attrs.evolve(self, conn=conn)
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = False):
+        """
+        commands in pipeline will be sent in one go when execute(),
+        which saves round trips for bulk operations.
+
+        :param transaction: execute the commands atomically in MULTI/EXEC,
+            still in one round trip
+
+        async with redis.pipeline() as pipe:
+            await pipe.hset("h", ("f", "v"))
+            await pipe.expire("h", 60)
+            assert await pipe.execute() == [1, 1]
+        """
+        async with self._pool.acquire_then_release() as conn:
+            with Pipeline(conn, transaction) as pipe:
+                yield pipe
+
+    async def transaction(self, fn: Callable[[Pipeline], Awaitable]) -> list:
+        """
+        MULTI, the commands buffered by fn, then EXEC, all in one round trip
+
+        async def _incr_expire(pipe: Pipeline):
+            await pipe.incr("counter")
+            await pipe.expire("counter", 60)
+
+        assert await redis.transaction(_incr_expire) == [1, 1]
+
+        :return: [reply] of EXEC
+        """
+        async with self.pipeline(transaction=True) as pipe:
+            await fn(pipe)
+            return await pipe.execute()
+
+    async def lpush_many(self, *key_elements: tuple[String, list[String]]) -> list:
+        """
+        LPUSH to many lists in one round trip, by a pipeline
+
+        :return: [length of list after the push]
+        """
+        return await self._push_many(b"LPUSH", key_elements)
+
+    async def rpush_many(self, *key_elements: tuple[String, list[String]]) -> list:
+        """
+        RPUSH to many lists in one round trip, by a pipeline
+
+        :return: [length of list after the push]
+        """
+        return await self._push_many(b"RPUSH", key_elements)
+
+    async def _push_many(self, cmd: Cmd, key_elements):
+        async with self.pipeline() as pipe:
+            for key, elements in key_elements:
+                pipe.queue(cmd, key, *elements)
+
+            return await pipe.execute()
+
+    async def mget_many(self, keys: Sequence[String], chunk: int = 200) -> list:
+        """
+        MGET of many keys, in chunks which run concurrently on the connections
+        of the pool; so one big MGET does not hold a connection for long
+
+        :return: values in the order of keys
+        """
+        chunks = [keys[i : i + chunk] for i in range(0, len(keys), chunk)]
+        replies = await self._concurrently(b"MGET", chunks)
+        return list(chain.from_iterable(replies))
+
+    async def mset_many(self, *key_value: tuple[String, String], chunk: int = 200):
+        """
+        MSET in chunks which run concurrently on the connections of the pool;
+        unlike mset(), it is not atomic as a whole
+
+        :return: [reply of MSET] of the chunks
+        """
+        flat = list(chain.from_iterable(key_value))
+        step = chunk * 2
+        chunks = [flat[i : i + step] for i in range(0, len(flat), step)]
+        return await self._concurrently(b"MSET", chunks)
+
+    async def _concurrently(self, cmd: Cmd, chunks: list[Sequence[Arg]]) -> list:
+        # a bound connection can not be shared by tasks
+        if self._conn is not None or len(chunks) < 2:
+            return [await self._round_trip_seq(cmd, args) for args in chunks]
+
+        replies = [None] * len(chunks)
+
+        async def _round_trip(i: int, args: Sequence[Arg]):
+            replies[i] = await self._round_trip_seq(cmd, args)
+
+        async with trio.open_nursery() as nursery:
+            for i, args in enumerate(chunks):
+                nursery.start_soon(_round_trip, i, args)
+
+        return replies
+
     @classmethod
     def from_addr(
-        cls, host: str, port: int, pool_size: int = 20, hello: Hello = Hello()
+        cls,
+        host: str,
+        port: int,
+        pool_size: int = 20,
+        hello: Hello = Hello(),
+        multiplex: bool = False,
+        open_stream: Callable[
+            [str, int], Awaitable[HalfCloseableStream]
+        ] = trio.open_tcp_stream,
+        reader: Callable[[], Reader] = Reader,
     ):
+        """
+        :param multiplex: concurrent commands share one connection and get
+            pipelined implicitly, see Multiplexer; then redis must be used as
+            an async context manager
+        :param open_stream: see Connection.from_addr()
+        :param reader: see Connection.from_addr(); HiredisReader parses in C,
+            but returns a few reply types differently
+        """
+
         async def _conn_factory():
-            conn = await Connection.from_addr(host, port)
+            conn = await Connection.from_addr(host, port, open_stream, reader)
             reply = await conn.hello(hello)
 
             _log.debug("hello: %s", reply)
@@ -64,11 +250,12 @@ class Redis(
             return conn
 
         pool = Pool(factory=_conn_factory, max_num=pool_size)
+        mux = Multiplexer(factory=_conn_factory) if multiplex else None
 
-        return cls(pool=pool)
+        return cls(pool=pool, mux=mux)
 
 
-@attrs.define
+@attrs.define(weakref_slot=False, eq=False)
 class Transaction(
     KeysMixin,
     StringsMixin,
@@ -77,37 +264,82 @@ class Transaction(
     ConnectionMixin,
     ServerMixin,
     HashesMixin,
+    ScriptingMixin,
     TransactionsMixin,
 ):
     """
     compare to Redis, Transaction extends TransactionsMixin
+
+    when buffered, MULTI and the commands after it are buffered rather than
+    being sent, and awaiting them returns a PendingReply; exec() or discard()
+    sends them all in one write. the replies of them are QUEUED or errors,
+    so only WATCH and the reads before multi() need round trips.
     """
 
     _conn: Connection
+    _buffered: bool = False
 
     _tx_count: int = attrs.field(init=False, default=0)
     """ +1 when multi, -1 when exec/discard """
+    _queued: list[bytes] = attrs.field(init=False, factory=list)
+    _pending: list[PendingReply] = attrs.field(init=False, factory=list)
 
     async def _round_trip(self, cmd: Cmd, *args: Arg):
+        if self._buffered and self._tx_count > 0:
+            return self._queue(pack_cmd(cmd, *args))
         return await self._conn.round_trip(cmd, *args)
 
+    async def _round_trip_seq(self, cmd: Cmd, args: Sequence[Arg]):
+        if self._buffered and self._tx_count > 0:
+            return self._queue(pack_cmd_seq(cmd, args))
+        return await self._conn.round_trip_packed(pack_cmd_seq(cmd, args))
+
+    async def _send_prebuilt(self, prefix: bytes, *args: Arg):
+        if self._buffered and self._tx_count > 0:
+            return self._queue(pack_prebuilt(prefix, *args))
+        return await self._conn.round_trip_packed(pack_prebuilt(prefix, *args))
+
+    def _queue(self, packed: bytes) -> PendingReply:
+        self._queued.append(packed)
+        pending = PendingReply()
+        self._pending.append(pending)
+        return pending
+
+    async def _flush(self, last: bytes):
+        """send the buffered frames followed by EXEC/DISCARD in one write"""
+        queued, self._queued = self._queued, []
+        pending, self._pending = self._pending, []
+
+        replies = await self._conn.round_trip_many([*queued, last])
+
+        for reply, pend in zip(replies, pending):
+            pend.done = True
+            pend.value = reply
+
+        return replies[-1]
+
     async def multi(self):
         self._tx_count += 1
         return await super().multi()
 
     async def discard(self):
         self._tx_count -= 1
+        if self._queued:
+            return await self._flush(DISCARD_PREFIX)
         return await super().discard()
 
     async def exec(self):
         self._tx_count -= 1
+        if self._queued:
+            return await self._flush(EXEC_PREFIX)
         return await super().exec()
 
     def __enter__(self):
         return self
 
-    def __exit__(self, exc, exc_type, tb):
-        if self._tx_count != 0:
+    def __exit__(self, exctype, exc, tb):
+        # not to mask an exception, eg. a cancellation, which left it unmatched
+        if exc is None and self._tx_count != 0:
             raise RuntimeError("unmatched transaction acquiring and releasing")
 
         # TODO@haoliang need to destory this dirty conn? as user can catch the
@@ -0,0 +1,73 @@
+from hashlib import sha1
+
+import attrs
+from respy3.protocol import RedisError
+
+from ..typing import Arg, RoundTrip, String
+
+
+@attrs.define(frozen=True)
+class Script:
+    """a lua script and its sha1 digest, which is computed once"""
+
+    source: bytes
+    sha: bytes = attrs.field(init=False)
+
+    @sha.default
+    def _digest(self):
+        return sha1(self.source).hexdigest().encode()
+
+
+async def run_script(
+    rt: RoundTrip, script: Script, keys: tuple[String, ...], args: tuple[Arg, ...]
+):
+    """
+    run by EVALSHA, fallback to EVAL once redis knows nothing about it;
+    EVAL caches the script as well, so it costs one round trip either way.
+
+    in a pipeline the NOSCRIPT error can only be seen in its replies.
+    """
+
+    reply = await rt._round_trip(b"EVALSHA", script.sha, len(keys), *keys, *args)
+
+    if isinstance(reply, RedisError) and reply.args[0] == b"NOSCRIPT":
+        reply = await rt._round_trip(b"EVAL", script.source, len(keys), *keys, *args)
+
+    return reply
+
+
+class ScriptingMixin(RoundTrip):
+    """https://redis.io/commands#scripting"""
+
+    __slots__ = ()
+
+    async def eval(
+        self, script: String, keys: tuple[String, ...] = (), args: tuple[Arg, ...] = ()
+    ):
+        """https://redis.io/commands/eval"""
+
+        return await self._round_trip(b"EVAL", script, len(keys), *keys, *args)
+
+    async def evalsha(
+        self, sha: String, keys: tuple[String, ...] = (), args: tuple[Arg, ...] = ()
+    ):
+        """https://redis.io/commands/evalsha"""
+
+        return await self._round_trip(b"EVALSHA", sha, len(keys), *keys, *args)
+
+    async def script_exists(self, *shas: String) -> list[int]:
+        """https://redis.io/commands/script-exists"""
+
+        return await self._round_trip(b"SCRIPT", b"EXISTS", *shas)
+
+    async def script_flush(self):
+        """https://redis.io/commands/script-flush"""
+
+        return await self._round_trip(b"SCRIPT", b"FLUSH")
+
+    async def script_load(self, script: String) -> bytes:
+        """
+        :return: sha1 digest of the script
+        """
+
+        return await self._round_trip(b"SCRIPT", b"LOAD", script)
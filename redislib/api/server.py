@@ -1,12 +1,30 @@
 from ..typing import RoundTrip, String
-from enum import Enum
+from ._frames import (
+    BGREWRITEAOF_PREFIX,
+    BGSAVE_PREFIX,
+    LASTSAVE_PREFIX,
+    LATENCY_DOCTOR_FRAME,
+    MEMORY_DOCTOR_FRAME,
+    ROLE_PREFIX,
+    TIME_PREFIX,
+)
 
 
 class ServerMixin(RoundTrip):
-    """https://redis.io/commands#server"""
+    """
+    https://redis.io/commands#server
 
-    async def bgrewriteaof(self):
-        """Instruct Redis to start an Append Only File rewrite process. The
+    methods hand out the awaitable of _round_trip() rather than awaiting it
+    in a coroutine of their own
+    """
+
+    __slots__ = ()
+
+    def bgrewriteaof(self, noreply=False):
+        """
+        :param noreply: return once sent, without the reply; by CLIENT REPLY SKIP
+
+        Instruct Redis to start an Append Only File rewrite process. The
         rewrite will create a small optimized version of the current Append Only File.
 
         If BGREWRITEAOF fails, no data gets lost as the old AOF will be untouched.
@@ -22,10 +40,16 @@ class ServerMixin(RoundTrip):
         Since Redis 2.4 the AOF rewrite is automatically triggered by Redis,
         however the BGREWRITEAOF command can be used to trigger a rewrite at
         any time."""
-        return await self._round_trip(b"BGREWRITEAOF")
+        if noreply:
+            return self._send_noreply(b"BGREWRITEAOF")
+
+        return self._send_prebuilt(BGREWRITEAOF_PREFIX)
 
-    async def bgsave(self):
-        """Save the DB in background.
+    def bgsave(self, noreply=False):
+        """
+        :param noreply: return once sent, without the reply; by CLIENT REPLY SKIP
+
+        Save the DB in background.
 
         Normally the OK code is immediately returned. Redis forks, the parent
         continues to serve the clients, the child saves the DB on disk then exits.
@@ -41,10 +65,16 @@ class ServerMixin(RoundTrip):
         A client may be able to check if the operation succeeded using the
         LASTSAVE command."""
 
-        return await self._round_trip(b"BGSAVE")
+        if noreply:
+            return self._send_noreply(b"BGSAVE")
+
+        return self._send_prebuilt(BGSAVE_PREFIX)
 
-    async def flushall(self, async_=False, sync=False):
-        """Delete all the keys of all the existing databases, not just the
+    def flushall(self, async_=False, sync=False, noreply=False):
+        """
+        :param noreply: return once sent, without the reply; by CLIENT REPLY SKIP
+
+        Delete all the keys of all the existing databases, not just the
         currently selected one. This command never fails.
 
         By default, FLUSHALL will synchronously flush all the databases.
@@ -61,16 +91,20 @@ class ServerMixin(RoundTrip):
         present at the time the command was invoked. Keys created during an
         asynchronous flush will be unaffected."""
 
-        def _args():
-            if async_:
-                yield "ASYNC"
-            if sync:
-                yield "SYNC"
+        send = self._send_noreply if noreply else self._round_trip
+
+        if async_:
+            return send(b"FLUSHALL", b"ASYNC")
+        if sync:
+            return send(b"FLUSHALL", b"SYNC")
 
-        return await self._round_trip(b"FLUSHALL", *_args())
+        return send(b"FLUSHALL")
 
-    async def flushdb(self, async_=False, sync=False):
-        """Delete all the keys of the currently selected DB. This command never fails.
+    def flushdb(self, async_=False, sync=False, noreply=False):
+        """
+        :param noreply: return once sent, without the reply; by CLIENT REPLY SKIP
+
+        Delete all the keys of the currently selected DB. This command never fails.
 
         By default, FLUSHDB will synchronously flush all keys from the
         database. Starting with Redis 6.2, setting the
@@ -86,29 +120,35 @@ class ServerMixin(RoundTrip):
         present at the time the command was invoked. Keys created during an
         asynchronous flush will be unaffected."""
 
-        def _args():
-            if async_:
-                yield "ASYNC"
-            if sync:
-                yield "SYNC"
-
-        return await self._round_trip(b"FLUSHDB", *_args())
-
-    class Info(Enum):
-        SERVER = "server"
-        CLIENTS = "clients"
-        MEMORY = "memory"
-        PERSISTENT = "persistent"
-        STATS = "stats"
-        REPLICATION = "replication"
-        CPU = "cpu"
-        COMMANDSTATS = "commandstats"
-        CLUSTER = "cluster"
-        KEYSPACE = "keyspace"
-        MODULES = "modules"
-        ERRORSTATS = "errorstats"
-
-    async def info(self, section: String = None):
+        send = self._send_noreply if noreply else self._round_trip
+
+        if async_:
+            return send(b"FLUSHDB", b"ASYNC")
+        if sync:
+            return send(b"FLUSHDB", b"SYNC")
+
+        return send(b"FLUSHDB")
+
+    class Info:
+        """sections of info(), as bytes which are sent as they are"""
+
+        SERVER = b"server"
+        CLIENTS = b"clients"
+        MEMORY = b"memory"
+        PERSISTENCE = b"persistence"
+        STATS = b"stats"
+        REPLICATION = b"replication"
+        CPU = b"cpu"
+        COMMANDSTATS = b"commandstats"
+        CLUSTER = b"cluster"
+        KEYSPACE = b"keyspace"
+        MODULES = b"modules"
+        ERRORSTATS = b"errorstats"
+
+        PERSISTENT = PERSISTENCE
+        """ deprecated, the former name of PERSISTENCE """
+
+    def info(self, section: String = None):
         """The INFO command returns information and statistics about the
         server in a format that is simple to parse by computers and easy to
         read by humans.
@@ -135,21 +175,20 @@ class ServerMixin(RoundTrip):
 
         When no parameter is provided, the default option is assumed."""
 
-        def _args():
-            if section:
-                yield section
+        if section:
+            return self._round_trip(b"INFO", section)
 
-        return await self._round_trip(b"INFO", *_args())
+        return self._round_trip(b"INFO")
 
-    async def lastsave(self):
+    def lastsave(self):
         """Return the UNIX TIME of the last DB save executed with success.
         A client may check if a BGSAVE command succeeded reading the LASTSAVE
         value, then issuing a BGSAVE command and checking at regular intervals
         every N seconds if LASTSAVE changed."""
 
-        return await self._round_trip(b"LASTSAVE")
+        return self._send_prebuilt(LASTSAVE_PREFIX)
 
-    async def latency_doctor(self):
+    def latency_doctor(self):
         """The LATENCY DOCTOR command reports about different latency-related
         issues and advises about possible remedies.
 
@@ -159,27 +198,27 @@ class ServerMixin(RoundTrip):
         deviation, and a human-readable analysis of the event. For certain
         events, like fork, additional information is provided, like the rate
         at which the system forks processes."""
-        return await self._round_trip(b"LATENCY", "DOCTOR")
+        return self._send_prebuilt(LATENCY_DOCTOR_FRAME)
 
-    async def memory_doctor(self):
+    def memory_doctor(self):
         """The MEMORY DOCTOR command reports about different memory-related
         issues that the Redis server experiences, and advises about possible
         remedies"""
-        return await self._round_trip(b"MEMORY", "DOCTOR")
+        return self._send_prebuilt(MEMORY_DOCTOR_FRAME)
 
-    async def role(self):
+    def role(self):
         """Provide information on the role of a Redis instance in the context
         of replication, by returning if the instance is currently a master,
         slave, or sentinel. The command also returns additional information
         about the state of the replication (if the role is master or slave) or
         the list of monitored master names (if the role is sentinel)."""
 
-        return await self._round_trip(b"ROLE")
+        return self._send_prebuilt(ROLE_PREFIX)
 
-    async def time(self):
+    def time(self):
         """The TIME command returns the current server time as a two items
         lists: a Unix timestamp and the amount of microseconds already elapsed
         in the current second. Basically the interface is very similar to the
         one of the gettimeofday system call."""
 
-        return await self._round_trip(b"TIME")
+        return self._send_prebuilt(TIME_PREFIX)
@@ -1,7 +1,22 @@
+from itertools import chain
+from typing import Union
+
 from ..typing import RoundTrip, String
+from ._frames import (
+    DECR_PREFIX,
+    DECRBY_PREFIX,
+    GET_PREFIX,
+    GETDEL_PREFIX,
+    INCR_PREFIX,
+    INCRBY_PREFIX,
+    SET_PREFIX,
+    SETNX_PREFIX,
+)
 
 
 class StringsMixin(RoundTrip):
+    __slots__ = ()
+
     async def decr(self, key: String):
         """Decrements the number stored at key by one. If the key does not
         exist, it is set to 0 before performing the operation. An error is
@@ -9,7 +24,7 @@ class StringsMixin(RoundTrip):
         a string that can not be represented as integer. This operation is
         limited to 64 bit signed integers."""
 
-        return await self._round_trip(b"DECR", key)
+        return await self._send_prebuilt(DECR_PREFIX, key)
 
     async def decrby(self, key: String, decrement: int):
         """Decrements the number stored at key by decrement. If the key does
@@ -18,21 +33,21 @@ class StringsMixin(RoundTrip):
         a string that can not be represented as integer. This operation is
         limited to 64 bit signed integers."""
 
-        return await self._round_trip(b"DECRBY", key, decrement)
+        return await self._send_prebuilt(DECRBY_PREFIX, key, decrement)
 
     async def get(self, key: String) -> bytes:
         """Get the value of key. If the key does not exist the special value
         nil is returned. An error is returned if the value stored at key is
         not a string, because GET only handles string values."""
 
-        return await self._round_trip(b"GET", key)
+        return await self._send_prebuilt(GET_PREFIX, key)
 
     async def getdel(self, key: String):
         """Get the value of key and delete the key. This command is similar to
         GET, except for the fact that it also deletes the key on success (if
         and only if the key's value type is a string)."""
 
-        return await self._round_trip(b"GETDEL", key)
+        return await self._send_prebuilt(GETDEL_PREFIX, key)
 
     async def getex(
         self,
@@ -56,21 +71,24 @@ class StringsMixin(RoundTrip):
         * PERSIST -- Remove the time to live associated with the key.
         """
 
-        def _args():
-            yield key
-
-            if ex is not None:
-                yield ex
-            if px is not None:
-                yield px
-            if exat is not None:
-                yield exat
-            if pxat is not None:
-                yield pxat
-            if persist:
-                yield "PERSIST"
-
-        return await self._round_trip(b"GETEX", *_args())
+        args = [key]
+
+        if ex is not None:
+            args.append(b"EX")
+            args.append(ex)
+        if px is not None:
+            args.append(b"PX")
+            args.append(px)
+        if exat is not None:
+            args.append(b"EXAT")
+            args.append(exat)
+        if pxat is not None:
+            args.append(b"PXAT")
+            args.append(pxat)
+        if persist:
+            args.append(b"PERSIST")
+
+        return await self._round_trip_seq(b"GETEX", args)
 
     async def incr(self, key: String):
         """Increments the number stored at key by one. If the key does not
@@ -87,7 +105,7 @@ class StringsMixin(RoundTrip):
         values that actually hold an integer, there is no overhead for storing
         the string representation of the integer."""
 
-        return await self._round_trip(b"INCR", key)
+        return await self._send_prebuilt(INCR_PREFIX, key)
 
     async def incrby(self, key: String, increment: int):
         """Increments the number stored at key by increment. If the key does
@@ -96,32 +114,34 @@ class StringsMixin(RoundTrip):
         a string that can not be represented as integer. This operation is
         limited to 64 bit signed integers."""
 
-        return await self._round_trip(b"INCRBY", key, increment)
+        return await self._send_prebuilt(INCRBY_PREFIX, key, increment)
 
     async def mget(self, *keys: String):
         """Returns the values of all specified keys. For every key that does
         not hold a string value or does not exist, the special value nil is
         returned. Because of this, the operation never fails."""
 
-        return await self._round_trip(b"MGET", *keys)
+        return await self._round_trip_seq(b"MGET", keys)
 
-    async def mset(self, *key_value: tuple[str, str]):
+    async def mset(self, *key_value: Union[tuple[String, String], String]):
         """Sets the given keys to their respective values. MSET replaces
         existing values with new values, just as regular SET. See MSETNX if
         you don't want to overwrite existing values.
 
         MSET is atomic, so all given keys are set at once. It is not possible
         for clients to see that some of the keys were updated while others are
-        unchanged."""
+        unchanged.
+
+        key_value can be given as pairs, tuples or lists: mset((k1, v1),
+        [k2, v2]), or flat: mset(k1, v1, k2, v2) which is passed down
+        without a copy."""
 
-        def _args():
-            for key, value in key_value:
-                yield key
-                yield value
+        if key_value and isinstance(key_value[0], (tuple, list)):
+            key_value = list(chain.from_iterable(key_value))
 
-        return await self._round_trip(b"MSET", *_args())
+        return await self._round_trip_seq(b"MSET", key_value)
 
-    async def msetnx(self, *key_value: tuple[str, str]):
+    async def msetnx(self, *key_value: Union[tuple[String, String], String]):
         """Sets the given keys to their respective values. MSETNX will not
         perform any operation at all even if just a single key already exists.
 
@@ -131,14 +151,14 @@ class StringsMixin(RoundTrip):
 
         MSETNX is atomic, so all given keys are set at once. It is not
         possible for clients to see that some of the keys were updated while
-        others are unchanged."""
+        others are unchanged.
+
+        key_value can be given as pairs or flat, see mset()."""
 
-        def _args():
-            for key, value in key_value:
-                yield key
-                yield value
+        if key_value and isinstance(key_value[0], (tuple, list)):
+            key_value = list(chain.from_iterable(key_value))
 
-        return await self._round_trip(b"MSETNX", *_args())
+        return await self._round_trip_seq(b"MSETNX", key_value)
 
     async def set(
         self,
@@ -177,32 +197,44 @@ class StringsMixin(RoundTrip):
         GETSET, it is possible that in future versions of Redis these commands
         will be deprecated and finally removed."""
 
-        def _args():
-            yield key
-            yield value
-
-            if ex is not None:
-                yield ex
-            if px is not None:
-                yield px
-            if exat is not None:
-                yield exat
-            if pxat is not None:
-                yield pxat
-            if keepttl:
-                yield "KEEPTTL"
-            if nx:
-                yield "NX"
-            if xx:
-                yield "XX"
-            if get:
-                yield "GET"
-
-        return await self._round_trip(b"SET", *_args())
+        # the plain SET is the most, which needs no option at all
+        if (
+            ex is None
+            and px is None
+            and exat is None
+            and pxat is None
+            and not (keepttl or nx or xx or get)
+        ):
+            return await self._send_prebuilt(SET_PREFIX, key, value)
+
+        args = [key, value]
+
+        if ex is not None:
+            args.append(b"EX")
+            args.append(ex)
+        if px is not None:
+            args.append(b"PX")
+            args.append(px)
+        if exat is not None:
+            args.append(b"EXAT")
+            args.append(exat)
+        if pxat is not None:
+            args.append(b"PXAT")
+            args.append(pxat)
+        if keepttl:
+            args.append(b"KEEPTTL")
+        if nx:
+            args.append(b"NX")
+        if xx:
+            args.append(b"XX")
+        if get:
+            args.append(b"GET")
+
+        return await self._round_trip_seq(b"SET", args)
 
     async def setnx(self, key: String, value: String):
         """Set key to hold string value if key does not exist. In that case,
         it is equal to SET. When key already holds a value, no operation is
         performed. SETNX is short for "SET if Not eXists"."""
 
-        return await self._round_trip(b"SETNX", key, value)
+        return await self._send_prebuilt(SETNX_PREFIX, key, value)
@@ -1,7 +1,10 @@
 from ..typing import RoundTrip
+from ._frames import DISCARD_PREFIX, EXEC_PREFIX, MULTI_PREFIX, UNWATCH_PREFIX
 
 
 class TransactionsMixin(RoundTrip):
+    __slots__ = ()
+
     async def exec(self):
         """Executes all previously queued commands in a transaction and
         restores the connection state to normal.
@@ -9,7 +12,7 @@ class TransactionsMixin(RoundTrip):
         When using WATCH, EXEC will execute commands only if the watched keys
         were not modified, allowing for a check-and-set mechanism."""
 
-        return await self._round_trip(b"EXEC")
+        return await self._send_prebuilt(EXEC_PREFIX)
 
     async def discard(self):
         """Flushes all previously queued commands in a transaction and
@@ -18,22 +21,22 @@ class TransactionsMixin(RoundTrip):
         If WATCH was used, DISCARD unwatches all keys watched by the
         connection."""
 
-        return await self._round_trip(b"DISCARD")
+        return await self._send_prebuilt(DISCARD_PREFIX)
 
     async def multi(self):
         """Marks the start of a transaction block. Subsequent commands will
         be queued for atomic execution using EXEC."""
 
-        return await self._round_trip(b"MULTI")
+        return await self._send_prebuilt(MULTI_PREFIX)
 
     async def watch(self, *keys: str):
         """Marks the given keys to be watched for conditional execution of
         a transaction."""
 
-        return await self._round_trip(b"WATCH", *keys)
+        return await self._round_trip_seq(b"WATCH", keys)
 
     async def unwatch(self):
         """Flushes all the previously watched keys for a transaction.
         If you call EXEC or DISCARD, there's no need to manually call UNWATCH."""
 
-        return await self._round_trip(b"UNWATCH")
+        return await self._send_prebuilt(UNWATCH_PREFIX)
@@ -1,15 +1,52 @@
-from typing import Union
+from itertools import chain
+from typing import Sequence, Union
 
 from ..typing import RoundTrip, String
+from ._frames import ZCARD_PREFIX, ZRANK_PREFIX, ZSCORE_PREFIX
+from .scripting import Script, run_script
+
+# ARGV: member, then the args of ZADD: [flag...], score, member
+_ZADD_SCORE = Script(
+    b"""
+redis.call('ZADD', KEYS[1], unpack(ARGV, 2))
+return redis.call('ZSCORE', KEYS[1], ARGV[1])
+"""
+)
+
+
+def _zadd_flags(
+    args: list,
+    nx: bool,
+    xx: bool,
+    gt: bool,
+    lt: bool,
+    ch: bool = False,
+    incr: bool = False,
+):
+    """append the flags of ZADD to args"""
+    if nx:
+        args.append(b"NX")
+    if xx:
+        args.append(b"XX")
+    if gt:
+        args.append(b"GT")
+    if lt:
+        args.append(b"LT")
+    if ch:
+        args.append(b"CH")
+    if incr:
+        args.append(b"INCR")
 
 
 class ZsetsMixin(RoundTrip):
     """https://redis.io/commands#sorted-set"""
 
+    __slots__ = ()
+
     async def zadd(
         self,
         key: String,
-        *score_member: tuple[float, str],
+        *score_member: Union[tuple[float, String], float, String],
         nx: bool = False,
         xx: bool = False,
         gt: bool = False,
@@ -99,33 +136,79 @@ class ZsetsMixin(RoundTrip):
                 sets by range of scores using ZRANGEBYSCORE).
         """
 
-        def _args():
-            yield key
+        args = [key]
+        _zadd_flags(args, nx, xx, gt, lt, ch, incr)
+
+        # as pairs: zadd(key, (s1, m1), [s2, m2]), or flat: zadd(key, s1, m1, s2, m2)
+        if score_member and isinstance(score_member[0], (tuple, list)):
+            args.extend(chain.from_iterable(score_member))
+        else:
+            args.extend(score_member)
+
+        return await self._round_trip_seq(b"ZADD", args)
+
+    async def zadd_arrays(
+        self,
+        key: String,
+        scores: Sequence[float],
+        members: Sequence[String],
+        nx: bool = False,
+        xx: bool = False,
+        gt: bool = False,
+        lt: bool = False,
+        ch: bool = False,
+    ):
+        """
+        zadd() of scores[i] and members[i], for big batches which are kept as
+        two arrays (eg. array.array('d') of scores) rather than pairs;
+        they are interleaved by zip() in C.
+        """
+
+        if len(scores) != len(members):
+            raise ValueError("scores and members should be of the same length")
+
+        args = [key]
+        _zadd_flags(args, nx, xx, gt, lt, ch)
+        args.extend(chain.from_iterable(zip(scores, members)))
+
+        return await self._round_trip_seq(b"ZADD", args)
+
+    async def zadd_score(
+        self,
+        key: String,
+        score: float,
+        member: String,
+        nx: bool = False,
+        xx: bool = False,
+        gt: bool = False,
+        lt: bool = False,
+    ):
+        """
+        ZADD then ZSCORE of the member in one round trip, by a lua script;
+        unlike zadd(incr=True), it returns the score when the member is not
+        updated due to nx/xx/gt/lt as well.
+
+        :return: score of the member, or None if it is not in the zset
+        """
+
+        args = [member]
+        _zadd_flags(args, nx, xx, gt, lt)
 
-            if nx:
-                yield "NX"
-            if xx:
-                yield "XX"
-            if gt:
-                yield "GT"
-            if lt:
-                yield "LT"
-            if ch:
-                yield "CH"
-            if incr:
-                yield "INCR"
+        args.append(score)
+        args.append(member)
 
-            for score, member in score_member:
-                yield score
-                yield member
+        reply = await run_script(self, _ZADD_SCORE, (key,), tuple(args))
 
-        return await self._round_trip(b"ZADD", *_args())
+        # a double from lua is converted to a bulk string
+        if isinstance(reply, bytes):
+            return float(reply)
+        return reply
 
     async def zcard(self, key: String):
         """Returns the sorted set cardinality (number of elements) of the
         sorted set stored at key."""
 
-        return await self._round_trip(b"ZCARD", key)
+        return await self._send_prebuilt(ZCARD_PREFIX, key)
 
     async def zrange(
         self,
@@ -263,25 +346,54 @@ class ZsetsMixin(RoundTrip):
         example below, after the first 8 bytes, we can store the value of the
         element we are indexing."""
 
-        def _args():
-            yield key
-            yield min
-            yield max
-
-            if byscore:
-                yield "BYSCORE"
-            if bylex:
-                yield "BYLEX"
-            if rev:
-                yield "REV"
-            if offset is not None and count is not None:
-                yield "LIMIT"
-                yield offset
-                yield count
-            if withscores:
-                yield "WITHSCORES"
-
-        return await self._round_trip(b"ZRANGE", *_args())
+        args = [key, min, max]
+
+        if byscore:
+            args.append(b"BYSCORE")
+        if bylex:
+            args.append(b"BYLEX")
+        if rev:
+            args.append(b"REV")
+        if offset is not None and count is not None:
+            args.append(b"LIMIT")
+            args.append(offset)
+            args.append(count)
+        if withscores:
+            args.append(b"WITHSCORES")
+
+        return await self._round_trip_seq(b"ZRANGE", args)
+
+    async def zrange_withscores(
+        self,
+        key: String,
+        min: Union[int, float],
+        max: Union[int, float],
+        byscore: bool = False,
+        bylex: bool = False,
+        rev: bool = False,
+        offset: int = None,
+        count: int = None,
+    ) -> list[tuple[bytes, float]]:
+        """
+        zrange(withscores=True), whose reply is made into (member, score)
+        pairs in both resp2 and resp3
+
+        :return: [(member, score)]
+        """
+
+        reply = await self.zrange(
+            key, min, max, byscore, bylex, rev, offset, count, withscores=True
+        )
+
+        if not isinstance(reply, list) or not reply:
+            return reply
+
+        # [[member, double]] in resp3, but [member, score-string, ...] in resp2
+        if isinstance(reply[0], list):
+            return list(map(tuple, reply))
+
+        it = iter(reply)
+        return list(zip(it, map(float, it)))
 
     async def zrank(self, key: String, member: String):
         """Returns the rank of member in the sorted set stored at key, with
@@ -291,13 +403,13 @@ class ZsetsMixin(RoundTrip):
         Use ZREVRANK to get the rank of an element with the scores ordered
         from high to low."""
 
-        return await self._round_trip(b"ZRANK", key, member)
+        return await self._send_prebuilt(ZRANK_PREFIX, key, member)
 
     async def zrem(self, key: String, *members: String):
         """Removes the specified members from the sorted set stored at key.
         Non existing members are ignored."""
 
-        return await self._round_trip(b"ZREM", key, *members)
+        return await self._round_trip_seq(b"ZREM", (key, *members))
 
     async def zremrangebyrank(self, key: String, start: int, stop: int):
         """Removes all elements in the sorted set stored at key with rank
@@ -317,18 +429,16 @@ class ZsetsMixin(RoundTrip):
     async def zscan(
         self, key: String, cursor: int, pattern: String = None, count: int = None
     ):
-        def _args():
-            yield key
-            yield cursor
+        args = [key, cursor]
 
-            if pattern:
-                yield "MATCH"
-                yield pattern
-            if count is not None:
-                yield "COUNT"
-                yield count
+        if pattern:
+            args.append(b"MATCH")
+            args.append(pattern)
+        if count is not None:
+            args.append(b"COUNT")
+            args.append(count)
 
-        return await self._round_trip(b"ZSCAN", *_args())
+        return await self._round_trip_seq(b"ZSCAN", args)
 
     async def zscore(self, key: String, member: String):
         """Returns the score of member in the sorted set at key.
@@ -336,7 +446,7 @@ class ZsetsMixin(RoundTrip):
         If member does not exist in the sorted set, or key does not exist, nil
         is returned."""
 
-        return await self._round_trip(b"ZSCORE", key, member)
+        return await self._send_prebuilt(ZSCORE_PREFIX, key, member)
 
     async def zpopmax(self, key: String, count: int = None):
         """Removes and returns up to count members with the highest scores in
@@ -348,12 +458,10 @@ class ZsetsMixin(RoundTrip):
         the highest score will be the first, followed by the elements with
         lower scores."""
 
-        def _args():
-            yield key
-            if count is not None:
-                yield count
+        if count is None:
+            return await self._round_trip(b"ZPOPMAX", key)
 
-        return await self._round_trip(b"ZPOPMAX", *_args())
+        return await self._round_trip(b"ZPOPMAX", key, count)
 
     async def zpopmin(self, key: String, count: int = None):
         """Removes and returns up to count members with the lowest scores in
@@ -365,9 +473,7 @@ class ZsetsMixin(RoundTrip):
         the lowest score will be the first, followed by the elements with
         greater scores."""
 
-        def _args():
-            yield key
-            if count is not None:
-                yield count
+        if count is None:
+            return await self._round_trip(b"ZPOPMIN", key)
 
-        return await self._round_trip(b"ZPOPMIN", *_args())
+        return await self._round_trip(b"ZPOPMIN", key, count)
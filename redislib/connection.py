@@ -1,44 +1,175 @@
 import logging
-from contextlib import AsyncExitStack, asynccontextmanager
-from typing import Awaitable, Callable
+import os
+from contextlib import AsyncExitStack
+from typing import Awaitable, Callable, Sequence
 
 import attr
 import attrs
 import trio
-from respy3 import Resp3Reader
-from trio import BrokenResourceError, Condition, Event, Lock, SocketStream
+from trio import BrokenResourceError, Event, Semaphore, WouldBlock
+from trio.abc import HalfCloseableStream
 
-from .typing import Arg, Cmd
+from .protocol import Reader
+from .typing import Arg, Cmd, String
+
+try:
+    from hiredis import pack_command as _hiredis_pack_command
+except ImportError:
+    _hiredis_pack_command = None
 
 _log = logging.getLogger(__name__)
 
+# below which concatenating frames is cheaper than the iovec of sendmsg()
+_SENDMSG_MIN_FRAMES = 4
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if hasattr(os, "sysconf") else 16
+# same as the default of trio.SocketStream.receive_some
+_RECEIVE_SIZE = 65536
+
+
+# "$<len>\r\n<int>\r\n" of small ints, which are common as cursors, counts, dbs
+# and the negative indices of ranges; _SMALL_INTS[i - _SMALL_INT_MIN] is of i
+_SMALL_INT_MIN = -16
+_SMALL_INT_MAX = 1024
+_SMALL_INTS = tuple(
+    b"$%d\r\n%d\r\n" % (len(str(i)), i) for i in range(_SMALL_INT_MIN, _SMALL_INT_MAX)
+)
+
+# "$<len>\r\n" of the common sizes of keys and values
+_BULK_HEADERS_MAX = 1024
+_BULK_HEADERS = tuple(b"$%d\r\n" % i for i in range(_BULK_HEADERS_MAX))
+
 
-def pack_cmd(cmd: Cmd, *args: Arg):
+def encode_key(key: String) -> bytes:
+    """
+    encode a str key once for reuse; the encoders take bytes as it is, so
+    a hot key is not encoded on every command.
+    """
+    if type(key) is bytes:
+        return key
+    return key.encode("utf-8")
+
+
+def _pack_arg(arg: Arg) -> bytes:
+    """the whole bulk string of an arg, for the uncommon types"""
+    if type(arg) is int and _SMALL_INT_MIN <= arg < _SMALL_INT_MAX:
+        return _SMALL_INTS[arg - _SMALL_INT_MIN]
+
+    if isinstance(arg, bool):
+        arg_bin = str(arg).encode("ascii")
+    elif isinstance(arg, int):
+        # an int subclass like IntEnum, whose str() is not always the number
+        arg_bin = b"%d" % arg
+    elif isinstance(arg, float):
+        arg_bin = b"%r" % float(arg)
+    elif isinstance(arg, str):
+        arg_bin = arg.encode("utf-8")
+    elif isinstance(arg, (bytes, bytearray)):
+        arg_bin = arg
+    else:
+        raise RuntimeError(f"unknown type for arg: {arg!r}")
+
+    return b"$%d\r\n%s\r\n" % (len(arg_bin), arg_bin)
+
+
+def _pack_cmd(cmd: Cmd, *args: Arg):
     """
     re-implemented respy3.write_command() with less bytes allocation
     """
+    return _pack_args(_cached_prefix(cmd, len(args)), args)
 
-    def _parts():
-        cmd_bin = cmd
-        yield "*{}".format(len(args) + 1).encode()
-        yield "${}".format(len(cmd_bin)).encode()
-        yield cmd_bin
 
-        for arg in args:
-            if isinstance(arg, (int, float)):
-                arg_bin = str(arg).encode()
-            elif isinstance(arg, str):
-                arg_bin = arg.encode("utf-8")
-            elif isinstance(arg, (bytes, bytearray)):
-                arg_bin = arg
-            else:
-                raise RuntimeError(f"unknown type for arg: {arg!r}")
-            yield "${}".format(len(arg_bin)).encode()
-            yield arg_bin
+def _pack_cmd_seq(cmd: Cmd, args: Sequence[Arg]):
+    return _pack_args(_cached_prefix(cmd, len(args)), args)
+
+
+# (cmd, argc) -> pack_prefix(cmd, argc); the commands are a few, but argc of
+# variadic ones is up to the callers, so only the small ones are kept
+_PREFIXES: dict[tuple[Cmd, int], bytes] = {}
+_PREFIXES_MAX_ARGC = 16
+
+
+def _cached_prefix(cmd: Cmd, argc: int) -> bytes:
+    key = (cmd, argc)
+    prefix = _PREFIXES.get(key)
+    if prefix is None:
+        prefix = pack_prefix(cmd, argc)
+        if argc <= _PREFIXES_MAX_ARGC:
+            _PREFIXES[key] = prefix
+    return prefix
+
+
+def _hiredis_pack_cmd(cmd: Cmd, *args: Arg):
+    """
+    hiredis.pack_command() encodes in C, but it refuses bool and bytearray
+    """
+    try:
+        return _hiredis_pack_command((cmd, *args))
+    except TypeError:
+        return _pack_cmd(cmd, *args)
+
+
+def _hiredis_pack_cmd_seq(cmd: Cmd, args: Sequence[Arg]):
+    try:
+        return _hiredis_pack_command((cmd, *args))
+    except TypeError:
+        return _pack_cmd_seq(cmd, args)
 
-        yield b""  # for trailing \r\n
 
-    return b"\r\n".join(_parts())
+pack_cmd = _pack_cmd if _hiredis_pack_command is None else _hiredis_pack_cmd
+pack_cmd_seq = _pack_cmd_seq if _hiredis_pack_command is None else _hiredis_pack_cmd_seq
+"""same as pack_cmd(), but takes the args as one sequence, to not copy big ones"""
+
+
+def pack_prefix(cmd: Cmd, argc: int) -> bytes:
+    """
+    the leading part of the frame of a command which takes exactly argc args,
+    it is meant to be computed once then be used with pack_prebuilt()
+    """
+    return b"*%d\r\n$%d\r\n%s\r\n" % (argc + 1, len(cmd), cmd)
+
+
+def pack_prebuilt(prefix: bytes, *args: Arg):
+    """
+    :param prefix: made by pack_prefix(); the number of args should match
+    """
+    if not args:  # a command without args, or a whole static frame
+        return prefix
+
+    return _pack_args(prefix, args)
+
+
+def _pack_args(prefix: bytes, args: Sequence[Arg]):
+    parts = [prefix]
+
+    # a loop inline rather than a generator or a call per arg, as keys and
+    # values are the most, exact type checks go first
+    for arg in args:
+        arg_type = type(arg)
+        if arg_type is str:
+            arg = arg.encode("utf-8")
+            arg_type = bytes
+
+        if arg_type is bytes:
+            size = len(arg)
+            if size < _BULK_HEADERS_MAX:
+                # join() copies them once, no intermediate bytes per arg
+                parts += (_BULK_HEADERS[size], arg, b"\r\n")
+            else:
+                parts.append(b"$%d\r\n%s\r\n" % (size, arg))
+        elif arg_type is int:
+            if _SMALL_INT_MIN <= arg < _SMALL_INT_MAX:
+                parts.append(_SMALL_INTS[arg - _SMALL_INT_MIN])
+            else:
+                # formatted into bytes directly, no str to encode
+                arg = b"%d" % arg
+                parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        elif arg_type is float:
+            arg = b"%r" % arg
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        else:
+            parts.append(_pack_arg(arg))
+
+    return b"".join(parts)
 
 
 class ClosedPoolError(Exception):
@@ -47,30 +178,40 @@ class ClosedPoolError(Exception):
 
 @attrs.define
 class Hello:
-    version = 3
     username: str = attrs.field(default=None)
     password: str = attrs.field(default=None)
     clientname: str = attrs.field(default=None)
+    version: int = attrs.field(default=3)
+    """ 3 unless the server only speaks resp2 """
 
     def as_args(self):
-        yield 3
+        yield self.version
 
         if self.username:
-            yield "AUTH"
+            yield b"AUTH"
             yield self.username
             yield self.password
 
         if self.clientname:
-            yield "SETNAME"
+            yield b"SETNAME"
             yield self.clientname
 
 
-@attrs.define(slots=False)
+_CLIENT_REPLY_SKIP_FRAME = pack_cmd(b"CLIENT", b"REPLY", b"SKIP")
+_DEFAULT_HELLO = Hello()
+# each connection says it on connect
+_HELLO3_FRAME = pack_cmd(b"HELLO", 3)
+
+
+@attrs.define
 class Connection:
-    _sock: SocketStream
-    # TODO@haoliang since we will re-assign self.round_trip, _said_hello is really needed?
+    _sock: HalfCloseableStream
     _said_hello: bool = attrs.field(default=False)
-    _protocol: Resp3Reader = attrs.field(init=False, factory=Resp3Reader)
+    _protocol: Reader = attrs.field(factory=Reader, kw_only=True)
+    """ Reader, or a HiredisReader """
+    _rx: bytearray = attrs.field(init=False, factory=bytearray)
+    proto: int = attrs.field(init=False, default=None)
+    """ the protocol version negotiated by hello() """
 
     def __hash__(self):
         return hash(self._sock)
@@ -79,48 +220,182 @@ class Connection:
         if self._said_hello:
             return
 
-        reply = await self._round_trip(b"HELLO", *hi.as_args())
+        if hi == _DEFAULT_HELLO:
+            packed = _HELLO3_FRAME
+        else:
+            packed = pack_cmd(b"HELLO", *hi.as_args())
+
+        await self._sock.send_all(packed)
+        reply = await self.receive_reply()
         self._said_hello = True
 
-        self.round_trip = self._round_trip  # type: ignore
+        if isinstance(reply, list):  # resp2 has no map type
+            it = iter(reply)
+            reply = dict(zip(it, it))
+        if isinstance(reply, dict):
+            self.proto = reply.get(b"proto")
 
         return reply
 
-    async def _round_trip(self, cmd: Cmd, *args: Arg):
+    async def round_trip(self, cmd: Cmd, *args: Arg):
+        if not self._said_hello:
+            raise RuntimeError("need to say hello to redis first")
+
         protocol = self._protocol
         packed = pack_cmd(cmd, *args)
         sock = self._sock
 
         await sock.send_all(packed)
+        await self._receive_some()
 
-        while True:
-            bite = await sock.receive_some()
+        # a small reply is there after the first read, mostly
+        result = protocol.get_object()
+        if result is protocol.sentinel:
+            result = await self.receive_reply()
 
-            if bite == b"":
-                raise BrokenResourceError
+        return result
+
+    async def round_trip_packed(self, packed: bytes):
+        """
+        :param packed: frame of one command
+        """
+        await self.send_packed(packed)
+
+        return await self.receive_reply()
+
+    async def round_trip_many(self, frames: list[bytes]) -> list:
+        """
+        :param frames: made by pack_cmd()
+        :return: replies in the order of frames
+
+        send all commands at once, then collect their replies; one reply can
+        be an error, it will not stop the others.
+        """
+        await self.send_frames(frames)
+
+        return await self.receive_replies(len(frames))
+
+    async def send_packed(self, packed: bytes):
+        """send frame(s) made by pack_cmd()"""
+        if not self._said_hello:
+            raise RuntimeError("need to say hello to redis first")
+
+        await self._sock.send_all(packed)
+
+    async def send_noreply(self, packed: bytes):
+        """send a frame made by pack_cmd(), and let redis not reply it"""
+        await self.send_packed(_CLIENT_REPLY_SKIP_FRAME + packed)
+
+    async def send_frames(self, frames: list[bytes]):
+        """
+        send frames made by pack_cmd(), many frames will be sent by sendmsg()
+        as an iovec rather than being concatenated first.
+        """
+        # only SocketStream exposes its socket
+        sock = getattr(self._sock, "socket", None)
+
+        if len(frames) <= _SENDMSG_MIN_FRAMES or not hasattr(sock, "sendmsg"):
+            return await self.send_packed(b"".join(frames))
 
-            protocol.feed(bite)
+        if not self._said_hello:
+            raise RuntimeError("need to say hello to redis first")
 
+        while frames:
+            # as SocketStream.send_all() does, which is bypassed here
+            try:
+                sent = await sock.sendmsg(frames[:_IOV_MAX])
+            except OSError as e:
+                raise BrokenResourceError from e
+
+            done = 0
+            while done < len(frames) and sent >= len(frames[done]):
+                sent -= len(frames[done])
+                done += 1
+
+            frames = frames[done:]
+            if sent:
+                frames[0] = memoryview(frames[0])[sent:]
+
+    async def receive_reply(self):
+        """receive one reply; the following replies stay buffered in protocol"""
+        protocol = self._protocol
+
+        while True:
             result = protocol.get_object()
 
             if result is not protocol.sentinel:
                 break
 
-        assert not (
-            protocol.new_state_stack and protocol.state_stack
-        ), "protocol in dirty state"
+            await self._receive_some()
 
         return result
 
-    async def round_trip(self, cmd: Cmd, *args: Arg):
-        assert not self._said_hello
-        raise RuntimeError("need to say hello to redis first")
+    async def receive_replies(self, n: int) -> list:
+        """
+        receive n replies; all the buffered ones are parsed in one go, it only
+        awaits when more bytes are needed
+        """
+        protocol = self._protocol
+        replies = protocol.get_objects(n)
 
-    @classmethod
-    async def from_addr(cls, host: str, port: int):
-        sock = await trio.open_tcp_stream(host, port)
+        while len(replies) < n:
+            await self._receive_some()
+            replies.extend(protocol.get_objects(n - len(replies)))
+
+        return replies
+
+    async def _receive_some(self):
+        """
+        receive bytes as many as available into protocol, which can be
+        several replies or a part of one.
 
-        return cls(sock=sock)
+        the socket reads into a buffer which is kept for reuse, rather than
+        allocates a new bytes for every read.
+        """
+        protocol = self._protocol
+        # a large blob can be read in one go, rather than bite by bite
+        size = max(protocol.wanted, _RECEIVE_SIZE)
+        # only SocketStream exposes its socket
+        sock = getattr(self._sock, "socket", None)
+
+        # the buffer is not grown for large blobs, to not keep it forever
+        if size > _RECEIVE_SIZE or not hasattr(sock, "recv_into"):
+            bite = await self._sock.receive_some(size)
+            if bite == b"":
+                raise BrokenResourceError
+            return protocol.feed(bite)
+
+        if not self._rx:
+            self._rx = bytearray(_RECEIVE_SIZE)
+
+        try:
+            nbytes = await sock.recv_into(self._rx, size)
+        except OSError as e:
+            raise BrokenResourceError from e
+
+        if nbytes == 0:
+            raise BrokenResourceError
+
+        # a part of the buffer, without a copy or even a memoryview
+        protocol.feed(self._rx, 0, nbytes)
+
+    @classmethod
+    async def from_addr(
+        cls,
+        host: str,
+        port: int,
+        open_stream: Callable[
+            [str, int], Awaitable[HalfCloseableStream]
+        ] = trio.open_tcp_stream,
+        reader: Callable[[], Reader] = Reader,
+    ):
+        """
+        :param open_stream: to use another transport than trio's sockets
+        :param reader: the reply parser, eg. HiredisReader to parse in C
+        """
+        sock = await open_stream(host, port)
+
+        return cls(sock=sock, protocol=reader())
 
     async def __aenter__(self):
         return self
@@ -136,7 +411,7 @@ class Connection:
 @attrs.define
 class Pool:
     """
-    we choose AsyncExitStack to close all connections safetly:
+    all the created connections are closed by aclose(), concurrently:
     * CON: there is no hijack() that user can choose not to release
 
     when pool has been closed, acquire() will raise;
@@ -147,69 +422,85 @@ class Pool:
     _factory: Callable[..., Awaitable["Connection"]]
     _max_num: int
 
-    _lock: Lock = attrs.field(init=False, factory=Lock)
-    _one_available: Condition = attrs.field(init=False, factory=Condition)
-    _acquired_num: int = attrs.field(init=False, default=0)
-    _conns: set[Connection] = attrs.field(init=False, factory=set)
+    _capacity: Semaphore = attrs.field(init=False)
+    """ bounds the acquired conns to max_num, and wakes a waiter on release """
+    _conns: list[Connection] = attrs.field(init=False, factory=list)
+    """ idle conns as a stack, so the most recently used one goes first """
+    _acquired: set[int] = attrs.field(init=False, factory=set)
+    """ id() of the acquired conns, rather than hashing conns """
     _closed: Event = attrs.field(init=False, factory=Event)
-    _exitstack: AsyncExitStack = attrs.field(init=False, factory=AsyncExitStack)
+    _created: list[Connection] = attrs.field(init=False, factory=list)
+    """ all the conns ever created, to be closed by aclose() """
+
+    @_capacity.default
+    def _new_capacity(self):
+        return Semaphore(self._max_num)
 
     async def acquire(self):
         if self._closed.is_set():
             raise ClosedPoolError
 
-        async with self._lock:
-            # take an idle conn
-            try:
-                conn = self._conns.pop()
-            except KeyError:
-                pass
-            else:
-                _log.debug("acquired idle %s", conn)
-                self._acquired_num += 1
-                return conn
-
-            # or, try to create one
-            if self._max_num > self._acquired_num:
-                conn = await self._factory()
-                _log.debug("acquired new %s", conn)
-                await self._exitstack.enter_async_context(conn)
-                self._acquired_num += 1
-                return conn
-
-        # or wait for someone releases one
-        async with self._one_available:
+        # a warm pool needs no checkpoint: there is no await between taking
+        # the slot and popping the conn, so no other task can interleave
+        try:
+            self._capacity.acquire_nowait()
+        except WouldBlock:
             _log.debug("full pool, waiting for release")
-            await self._one_available.wait()
+            await self._capacity.acquire()
 
-        async with self._lock:
+        # take an idle conn
+        if self._conns:
             conn = self._conns.pop()
-            _log.debug("acquired released %s", conn)
-            self._acquired_num += 1
+            self._acquired.add(id(conn))
             return conn
 
-    @asynccontextmanager
-    async def acquire_then_release(self):
-        conn = await self.acquire()
+        # or, create one within the slot
         try:
-            yield conn
-        finally:
-            await self.release(conn)
+            conn = await self._factory()
+        except BaseException:
+            self._capacity.release()
+            raise
+
+        _log.debug("acquired new %s", conn)
+        self._created.append(conn)
+        self._acquired.add(id(conn))
+        return conn
+
+    def acquire_then_release(self) -> "_Lease":
+        """
+        async with pool.acquire_then_release() as conn: ...
+
+        the conn is released on a normal exit, or discarded if the block
+        raises, as an interrupted command may leave its reply unread
+        """
+        return _Lease(self)
 
     async def release(self, conn: "Connection"):
         if self._closed.is_set():
             raise ClosedPoolError
 
-        async with self._lock:
-            if conn in self._conns:
-                return
+        if id(conn) not in self._acquired:
+            return
 
-            _log.debug("released %s", conn)
-            self._conns.add(conn)
-            self._acquired_num -= 1
+        self._acquired.discard(id(conn))
+        self._conns.append(conn)
+        self._capacity.release()
 
-            async with self._one_available:
-                self._one_available.notify(1)
+    async def discard(self, conn: "Connection"):
+        """
+        close an acquired conn rather than release it, as it can not be
+        reused; eg. its command was cancelled before the reply was read
+        """
+        if id(conn) not in self._acquired:
+            return
+
+        self._acquired.discard(id(conn))
+        self._created.remove(conn)
+        self._capacity.release()
+
+        # the caller is likely being cancelled
+        with trio.CancelScope(shield=True):
+            await conn.__aexit__(None, None, None)
 
     async def __aenter__(self):
         return self
@@ -218,13 +509,159 @@ class Pool:
         if self._closed.is_set():
             return
 
-        assert len(self._exitstack._exit_callbacks) == len(
+        assert len(self._created) == len(
             self._conns
-        ), "incompleted release: {} vs. {}".format(
-            len(self._exitstack._exit_callbacks), len(self._conns)
-        )
+        ), "incompleted release: {} vs. {}".format(len(self._created), len(self._conns))
 
         self._closed.set()
+
+        # one round of FINs for all conns, rather than one after another
+        async with trio.open_nursery() as nursery:
+            for conn in self._created:
+                nursery.start_soon(conn.__aexit__, None, None, None)
+
+    async def __aexit__(self, exctype, exc, tb):
+        await self.aclose()
+
+
+@attrs.define
+class _Lease:
+    """
+    the context manager of Pool.acquire_then_release(); a class rather than
+    an asynccontextmanager, as it is entered for every command
+    """
+
+    _pool: Pool
+    _conn: Connection = attrs.field(init=False, default=None)
+
+    async def __aenter__(self) -> Connection:
+        self._conn = await self._pool.acquire()
+        return self._conn
+
+    async def __aexit__(self, exctype, exc, tb):
+        if exctype is None:
+            await self._pool.release(self._conn)
+        else:
+            await self._pool.discard(self._conn)
+
+
+@attrs.define
+class _Call:
+    packed: bytes
+    done: Event = attrs.field(init=False, factory=Event)
+    reply: object = attrs.field(init=False, default=None)
+    error: Exception = attrs.field(init=False, default=None)
+
+
+@attrs.define
+class Multiplexer:
+    """
+    concurrent callers share one connection: a writer task coalesces the
+    frames of callers and flushes them with one send_all, a reader task
+    dispatches the replies back to callers in order. so the throughput no
+    longer depends on the size of pool.
+
+    * max_batch: at most how many frames to flush at once
+    * max_delay: seconds to wait for more frames before a flush; 0 means only
+      the frames of callers that are ready to run
+
+    it must not be used for commands that change the state of the
+    connection, like select, multi/exec, client reply and (p)subscribe.
+    """
+
+    _factory: Callable[..., Awaitable["Connection"]]
+    _max_batch: int = attrs.field(default=128)
+    _max_delay: float = attrs.field(default=0)
+
+    _calls: trio.MemorySendChannel = attrs.field(init=False, default=None)
+    _error: Exception = attrs.field(init=False, default=None)
+    _exitstack: AsyncExitStack = attrs.field(init=False, factory=AsyncExitStack)
+
+    async def round_trip(self, cmd: Cmd, *args: Arg):
+        return await self.round_trip_packed(pack_cmd(cmd, *args))
+
+    async def round_trip_packed(self, packed: bytes):
+        if self._calls is None:
+            raise RuntimeError("multiplexer has not been started")
+        if self._error is not None:
+            raise self._error
+
+        call = _Call(packed)
+        await self._calls.send(call)
+        await call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+
+        return call.reply
+
+    async def _write_loop(self, conn: Connection, calls, inflight):
+        async with inflight:
+            async for call in calls:
+                await trio.sleep(self._max_delay)
+
+                batch = [call]
+                while len(batch) < self._max_batch:
+                    try:
+                        batch.append(calls.receive_nowait())
+                    except trio.WouldBlock:
+                        break
+
+                if self._error is not None:
+                    self._fail(batch, self._error)
+                    continue
+
+                _log.debug("flushing %d frames", len(batch))
+
+                try:
+                    await conn.send_frames([call.packed for call in batch])
+                except Exception as e:
+                    self._fail(batch, e)
+                    continue
+
+                for call in batch:
+                    await inflight.send(call)
+
+    async def _read_loop(self, conn: Connection, inflight):
+        async for call in inflight:
+            if self._error is not None:
+                self._fail([call], self._error)
+                continue
+
+            try:
+                call.reply = await conn.receive_reply()
+            except Exception as e:
+                self._fail([call], e)
+                continue
+
+            call.done.set()
+
+    def _fail(self, calls, error: Exception):
+        self._error = error
+        for call in calls:
+            call.error = error
+            call.done.set()
+
+    async def __aenter__(self):
+        conn = await self._factory()
+        await self._exitstack.enter_async_context(conn)
+
+        calls_tx, calls_rx = trio.open_memory_channel(float("inf"))
+        inflight_tx, inflight_rx = trio.open_memory_channel(float("inf"))
+        nursery = await self._exitstack.enter_async_context(trio.open_nursery())
+        nursery.start_soon(self._write_loop, conn, calls_rx, inflight_tx)
+        nursery.start_soon(self._read_loop, conn, inflight_rx)
+
+        self._calls = calls_tx
+
+        return self
+
+    async def aclose(self):
+        if self._calls is None:
+            return
+
+        # the loops quit after all the sent calls got their replies
+        await self._calls.aclose()
         await self._exitstack.aclose()
 
     async def __aexit__(self, exctype, exc, tb):
@@ -0,0 +1,245 @@
+"""
+a RESP3 reply parser, compatible with respy3.Resp3Reader: feed(), get_object(), sentinel
+
+HiredisReader, with the same interface, parses in C by hiredis; it is opt-in
+since a few reply types differ, see it
+
+compare to respy3:
+* CRLF is located by bytearray.find() which is a memchr in C, rather than
+  `in` + index() + a slice per token
+* consumed bytes are dropped once per feed(), rather than once per token
+* an incomplete reply leaves its parsed part in a stack of aggregates, so
+  parsing resumes from where it stopped after the next feed()
+"""
+
+from respy3.protocol import ProtocolError, RedisError, RespPush
+
+try:
+    from hiredis import Reader as _HiredisCReader
+except ImportError:
+    _HiredisCReader = None
+
+_SIMPLE_STRING = ord("+")
+_SIMPLE_ERROR = ord("-")
+_NUMBER = ord(":")
+_BLOB = ord("$")
+_BLOB_ERROR = ord("!")
+_VERBATIM = ord("=")
+_NULL = ord("_")
+_DOUBLE = ord(",")
+_BOOLEAN = ord("#")
+_BIG_NUMBER = ord("(")
+_ARRAY = ord("*")
+_MAP = ord("%")
+_SET = ord("~")
+_PUSH = ord(">")
+_ATTRIBUTE = ord("|")
+
+_AGGREGATES = frozenset((_ARRAY, _MAP, _SET, _PUSH, _ATTRIBUTE))
+_BLOBS = frozenset((_BLOB, _BLOB_ERROR, _VERBATIM))
+
+# an attribute decorates the reply following it, we have no use for it yet
+_DISCARDED = object()
+
+
+def _error(line: bytes) -> RedisError:
+    error, _, message = line.partition(b" ")
+    return RedisError(error, message)
+
+
+def _aggregate(kind: int, items: list):
+    if kind == _ARRAY:
+        return items
+    if kind == _MAP:
+        it = iter(items)
+        return dict(zip(it, it))
+    if kind == _SET:
+        return set(items)
+    if kind == _PUSH:
+        return RespPush(items)
+    return _DISCARDED
+
+
+class Reader:
+    def __init__(self):
+        self.sentinel = object()
+
+        self._buf = bytearray()
+        self._pos = 0
+        """ where the next unparsed token starts """
+        self._stack: list[list] = []
+        """ [[kind, items, remaining]] of the aggregates being parsed """
+        self.wanted = 0
+        """ bytes still missing from an incomplete blob, 0 if unknown """
+
+    def feed(self, data: bytes, offset: int = 0, length: int = None):
+        """same as hiredis.Reader.feed(), data[offset:offset+length] is fed"""
+        if self._pos:
+            del self._buf[: self._pos]
+            self._pos = 0
+
+        if length is None and not offset:
+            self._buf += data
+        else:
+            if length is None:
+                length = len(data) - offset
+            with memoryview(data) as view:
+                self._buf += view[offset : offset + length]
+
+    def get_object(self):
+        """
+        :return: a whole reply, or sentinel if more data is needed
+        """
+        buf = self._buf
+        # a memoryview prevents buf from resizing, release it before return
+        with memoryview(buf) as view:
+            return self._parse(buf, view)
+
+    def get_objects(self, limit: int) -> list:
+        """
+        :return: up to limit whole replies that are available, maybe none
+        """
+        replies = []
+        buf = self._buf
+        sentinel = self.sentinel
+
+        with memoryview(buf) as view:
+            while len(replies) < limit:
+                result = self._parse(buf, view)
+                if result is sentinel:
+                    break
+                replies.append(result)
+
+        return replies
+
+    def _parse(self, buf: bytearray, view: memoryview):
+        self.wanted = 0
+        stack = self._stack
+        end = len(buf)
+        pos = self._pos
+
+        while True:
+            eol = buf.find(b"\r\n", pos)
+            if eol < 0:
+                break
+
+            kind = buf[pos]
+
+            if kind in _BLOBS:
+                length = int(buf[pos + 1 : eol])
+                if length < 0:  # the null of resp2
+                    value = None
+                    pos = eol + 2
+                else:
+                    start = eol + 2
+                    stop = start + length
+                    if stop + 2 > end:
+                        self.wanted = stop + 2 - end
+                        break
+                    value = view[start:stop].tobytes()
+                    pos = stop + 2
+
+                    if kind == _BLOB_ERROR:
+                        value = _error(value)
+                    elif kind == _VERBATIM:
+                        value = value[4:]  # after the format marker, eg. "txt:"
+            elif kind in _AGGREGATES:
+                length = int(buf[pos + 1 : eol])
+                pos = eol + 2
+
+                if kind == _MAP or kind == _ATTRIBUTE:
+                    length *= 2
+
+                if length > 0:
+                    stack.append([kind, [], length])
+                    continue
+
+                value = None if length < 0 else _aggregate(kind, [])
+            else:
+                line = buf[pos + 1 : eol]
+                pos = eol + 2
+
+                if kind == _SIMPLE_STRING:
+                    value = bytes(line)
+                elif kind == _NUMBER or kind == _BIG_NUMBER:
+                    value = int(line)
+                elif kind == _NULL:
+                    value = None
+                elif kind == _SIMPLE_ERROR:
+                    value = _error(bytes(line))
+                elif kind == _DOUBLE:
+                    value = float(line)
+                elif kind == _BOOLEAN:
+                    if line == b"t":
+                        value = True
+                    elif line == b"f":
+                        value = False
+                    else:
+                        raise ProtocolError(f"invalid boolean: {line!r}")
+                else:
+                    raise ProtocolError(f"unknown type: {chr(kind)!r}")
+
+            # hand the value over to its enclosing aggregates
+            while value is not _DISCARDED:
+                if not stack:
+                    self._pos = pos
+                    return value
+
+                frame = stack[-1]
+                frame[1].append(value)
+                frame[2] -= 1
+                if frame[2]:
+                    break
+
+                stack.pop()
+                value = _aggregate(frame[0], frame[1])
+
+        self._pos = pos
+        return self.sentinel
+
+
+class _HiredisError(RedisError):
+    """hiredis makes an error from the whole line, same args as _error() then"""
+
+    def __init__(self, line: str):
+        error, _, message = line.encode().partition(b" ")
+        super().__init__(error, message)
+
+
+class HiredisReader:
+    """
+    same interface as Reader, but parses in C by hiredis.Reader
+
+    compare to Reader:
+    * a set is returned as a list, a push as hiredis.PushNotification
+    * a big number is returned as bytes
+    * blob errors and attributes are not supported, which redis does not send
+      unless being asked to
+
+    so it is not the default, use it by Redis.from_addr(reader=HiredisReader)
+    """
+
+    def __init__(self):
+        if _HiredisCReader is None:
+            raise RuntimeError("HiredisReader needs hiredis to be installed")
+
+        self.sentinel = object()
+        self.wanted = 0
+        """ unknown by hiredis, which buffers an incomplete blob itself """
+
+        reader = _HiredisCReader(replyError=_HiredisError, notEnoughData=self.sentinel)
+        self.feed = reader.feed
+        self.get_object = reader.gets
+
+    def get_objects(self, limit: int) -> list:
+        replies = []
+        gets = self.get_object
+        sentinel = self.sentinel
+
+        while len(replies) < limit:
+            result = gets()
+            if result is sentinel:
+                break
+            replies.append(result)
+
+        return replies
@@ -8,14 +8,21 @@ notes:
     * https://redis.io/commands/scan#why-scan-may-return-all-the-items-of-an-aggregate-data-type-in-a-single-call
 """
 
+from typing import AsyncIterator
+
 import attrs
+import trio
 from attrs import field
 
 from .api.redis import Redis
+from .connection import encode_key
 from .typing import String
 
+# encoded once for all the pages
+_optional_key = attrs.converters.optional(encode_key)
+
 
-@attrs.define(slots=False)
+@attrs.define
 class Scanner:
     """https://redis.io/commands/scan"""
 
@@ -25,6 +32,16 @@ class Scanner:
     _cursor: bytes = field(init=False, default=b"0")
     _stash: list = field(init=False, factory=list)
 
+    _nursery: trio.Nursery = field(default=None, kw_only=True)
+    """
+    when given, the next page is requested in it while the current one is
+    being consumed; not for a Redis bound by Redis.connection().
+    aclose() the scanner if the iteration stops early, or the prefetch keeps
+    running in the nursery.
+    """
+    _prefetched: trio.MemoryReceiveChannel = field(init=False, default=None)
+    _prefetch_scope: trio.CancelScope = field(init=False, default=None)
+
     def __aiter__(self):
         if self._state != "init":
             raise RuntimeError("illegal state to start iter")
@@ -35,55 +52,106 @@ class Scanner:
     async def _scan(self):
         raise NotImplementedError
 
-    async def __anext__(self) -> bytes:
-        async def _next():
-            try:
-                return self._stash.pop()
-            except IndexError:
-                if self._state == "scanned":
-                    self._state = "stopped"
-                    assert self._cursor == b"0"
-                    raise StopAsyncIteration
+    async def _next_page(self) -> list:
+        """scan the next page, or take the prefetched one; then moves cursor"""
+        if self._prefetched is None:
+            cursor, stash = await self._scan()
+        else:
+            async with self._prefetched as prefetched:
+                cursor, stash = await prefetched.receive()
+            self._prefetched = None
+
+        self._cursor = cursor
+
+        if cursor == b"0":
+            self._state = "scanned"
+        elif self._nursery is not None:
+            send, self._prefetched = trio.open_memory_channel(1)
+            self._prefetch_scope = trio.CancelScope()
+            self._nursery.start_soon(self._prefetch, send, self._prefetch_scope)
+
+        return stash
+
+    async def _prefetch(self, send: trio.MemorySendChannel, scope: trio.CancelScope):
+        with scope:
+            async with send:
+                await send.send(await self._scan())
+
+    async def aclose(self):
+        """stop the iteration, and cancel the prefetch if any"""
+        self._state = "stopped"
+        self._stash = []
+
+        if self._prefetch_scope is not None:
+            self._prefetch_scope.cancel()
+        if self._prefetched is not None:
+            await self._prefetched.aclose()
+            self._prefetched = None
+
+    async def batches(self) -> AsyncIterator[list]:
+        """
+        yield the items page by page in the order of replies, instead of item
+        by item; so one await per SCAN rather than per item
+
+        async for keys in SCAN(redis, count=100).batches():
+            await redis.del_(*keys)
+
+        to break out with a prefetch, close the generator at once by
+        contextlib.aclosing(), which also acloses the scanner.
+        """
+        if self._state != "init":
+            raise RuntimeError("illegal state to start iter")
 
-                cursor, stash = await self._scan()
+        self._state = "started"
 
-                self._cursor = cursor
-                self._stash = stash
+        try:
+            while self._state != "scanned":
+                stash = await self._next_page()
 
-                if cursor == b"0":
-                    self._state = "scanned"
+                # scan may return zero stash
+                if stash:
+                    yield stash
+        finally:
+            await self.aclose()
 
-                    if not stash:
-                        self._state = "stopped"
-                        raise StopAsyncIteration
+    async def __anext__(self) -> bytes:
+        if not self._stash:
+            await self._refill()
 
-                # scan may return zero stash
-                return self._stash.pop()
+        return self._stash.pop()
 
+    async def _refill(self):
+        """scan until the stash has items, or raise StopAsyncIteration"""
         if self._state == "stopped":
             raise StopAsyncIteration
 
         if self._state not in ("started", "scanned"):
             raise RuntimeError("illegal state to next")
 
-        while True:
-            try:
-                return await _next()
-            except IndexError:
-                pass
+        # scan may return zero stash, then scan again
+        while not self._stash:
+            if self._state == "scanned":
+                self._state = "stopped"
+                assert self._cursor == b"0"
+                raise StopAsyncIteration
+
+            stash = await self._next_page()
+            # to pop in the order of the reply
+            stash.reverse()
+            self._stash = stash
 
 
 @attrs.define
 class ZSCAN(Scanner):
     """
-    yield score
     yield member
+    yield score
     ...
     """
 
     _redis: Redis
-    _key: String
-    _pattern: String = field(default=None)
+    _key: String = field(converter=encode_key)
+    _pattern: String = field(default=None, converter=_optional_key)
     # TODO@haoliang dynamic count
     _count: int = field(default=None)
 
@@ -101,10 +169,10 @@ class SCAN(Scanner):
     """
 
     _redis: Redis
-    _pattern: String = field(default=None)
+    _pattern: String = field(default=None, converter=_optional_key)
     # TODO@haoliang dynamic count
     _count: int = field(default=None)
-    _type: String = field(default=None)
+    _type: String = field(default=None, converter=_optional_key)
 
     async def _scan(self):
         return await self._redis.scan(
@@ -121,8 +189,8 @@ class HSCAN(Scanner):
     """
 
     _redis: Redis
-    _key: String
-    _pattern: String = field(default=None)
+    _key: String = field(converter=encode_key)
+    _pattern: String = field(default=None, converter=_optional_key)
     # TODO@haoliang dynamic count
     _count: int = field(default=None)
 
@@ -140,8 +208,8 @@ class SSCAN(Scanner):
     """
 
     _redis: Redis
-    _key: String
-    _pattern: String = field(default=None)
+    _key: String = field(converter=encode_key)
+    _pattern: String = field(default=None, converter=_optional_key)
     # TODO@haoliang dynamic count
     _count: int = field(default=None)
 
@@ -154,13 +222,13 @@ class SSCAN(Scanner):
 class PairedZSCAN(ZSCAN):
     """yield (member, score)"""
 
-    async def __anext__(self) -> tuple[bytes, float]:  # type: ignore
-        super_anext = super().__anext__
-
-        async def _next():
-            score = await super_anext()
-            member = await super_anext()
+    __slots__ = ()
 
-            return member, float(score)
+    async def __anext__(self) -> tuple[bytes, float]:  # type: ignore
+        # a page always has whole pairs
+        if not self._stash:
+            await self._refill()
 
-        return await _next()
+        stash = self._stash
+        member = stash.pop()
+        return member, float(stash.pop())
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Sequence, Union
 
 Cmd = bytes
 Arg = Union[str, int, float, bytes]
@@ -6,5 +6,27 @@ String = Union[str, bytes]
 
 
 class RoundTrip:
+    __slots__ = ()
+
     async def _round_trip(self, cmd: Cmd, *args: Arg):
         raise NotImplementedError
+
+    async def _send_prebuilt(self, prefix: bytes, *args: Arg):
+        """
+        :param prefix: see connection.pack_prefix()
+        """
+        raise NotImplementedError
+
+    async def _round_trip_seq(self, cmd: Cmd, args: Sequence[Arg]):
+        """
+        same as _round_trip(), but takes the args as they are, rather than
+        copying them into another tuple for every call down the stack
+        """
+        return await self._round_trip(cmd, *args)
+
+    async def _send_noreply(self, cmd: Cmd, *args: Arg):
+        """
+        send a command without waiting for its reply; which falls back to
+        _round_trip() where a reply can not be skipped.
+        """
+        return await self._round_trip(cmd, *args)
@@ -1,4 +1,10 @@
-from redislib import Redis
+from array import array
+
+import pytest
+
+from redislib import Hello, Redis
+from redislib.api.hashes import _HSET_EX
+from redislib.api.zsets import _ZADD_SCORE
 
 
 async def test_ping(redis: Redis):
@@ -8,3 +14,143 @@ async def test_ping(redis: Redis):
 async def test_mset(redis: Redis):
     pairs = ((str(i), str(i)) for i in range(100))
     assert await redis.mset(*pairs) == b'OK'
+
+    assert await redis.mset("mset:1", "1", "mset:2", "2") == b'OK'
+    assert await redis.mget("mset:1", "mset:2") == [b"1", b"2"]
+
+
+async def test_zadd_flat(redis: Redis):
+    assert await redis.zadd("zadd:1", 1, "a", 2.5, "b") == 2
+    assert await redis.zadd("zadd:1", (3, "c"), ch=True) == 1
+    assert await redis.zrange("zadd:1", 0, -1) == [b"a", b"b", b"c"]
+    assert await redis.zpopmax("zadd:1") == [b"c", 3.0]
+    assert await redis.zpopmin("zadd:1", 2) == [[b"a", 1.0], [b"b", 2.5]]
+
+
+async def test_list_pairs(redis: Redis):
+    assert await redis.mset(["pairs:1", "1"], ["pairs:2", "2"]) == b"OK"
+    assert await redis.msetnx(["pairs:3", "3"]) == 1
+    assert await redis.mget("pairs:1", "pairs:2", "pairs:3") == [b"1", b"2", b"3"]
+
+    assert await redis.zadd("pairs:4", [1, "a"], [2, "b"]) == 2
+    assert await redis.zrange("pairs:4", 0, -1) == [b"a", b"b"]
+
+
+async def test_zadd_arrays(redis: Redis):
+    scores = array("d", range(100))
+    members = [f"m{i}" for i in range(100)]
+
+    assert await redis.zadd_arrays("zadd:3", scores, members) == 100
+    assert await redis.zrange_withscores("zadd:3", 98, -1) == [(b"m98", 98.0), (b"m99", 99.0)]
+    assert await redis.zadd_arrays("zadd:3", [0, 1], ["m0", "new"], ch=True, nx=True) == 1
+
+    with pytest.raises(ValueError):
+        await redis.zadd_arrays("zadd:3", scores, members[1:])
+
+
+async def test_expire_gt_lt(redis: Redis):
+    await redis.set("expire:1", "1")
+    await redis.expire("expire:1", 100)
+
+    assert await redis.expire("expire:1", 10, gt=True) == 0
+    assert await redis.expire("expire:1", 10, lt=True) == 1
+    assert await redis.ttl("expire:1") == 10
+
+
+async def test_hgetall_hmget(redis: Redis):
+    await redis.hset("hash:1", ("f1", "v1"), ("f2", "v2"))
+
+    assert await redis.hgetall("hash:1") == {b"f1": b"v1", b"f2": b"v2"}
+    assert await redis.hmget("hash:1", "f2", b"f3") == {b"f2": b"v2", b"f3": None}
+    assert await redis.hmget("hash:1", "f1", "f1") == {b"f1": b"v1"}
+
+
+async def test_hset_ex(redis: Redis):
+    assert await redis.script_load(_HSET_EX.source) == _HSET_EX.sha
+
+    assert await redis.hset_ex("hash:2", 60, ("f1", "v1"), ("f2", "v2")) == 2
+    assert await redis.hset_ex("hash:2", 30, ("f1", "v0")) == 0
+    assert await redis.hgetall("hash:2") == {b"f1": b"v0", b"f2": b"v2"}
+    assert await redis.ttl("hash:2") == 30
+
+
+async def test_hgetall_resp2(redis: Redis):
+    await redis.hset("hash:3", ("f1", "v1"))
+
+    async with Redis.from_addr("127.0.0.1", 63790, hello=Hello(version=2)) as rds:
+        assert await rds.hgetall("hash:3") == {b"f1": b"v1"}
+
+
+async def test_bound_connection(redis: Redis):
+    async with redis.connection() as rds:
+        await rds.set("bound:1", "0")
+        for _ in range(10):
+            await rds.incr("bound:1")
+        assert await rds.get("bound:1") == b"10"
+
+
+async def test_noreply():
+    async with Redis.from_addr("127.0.0.1", 63790, pool_size=1) as rds:
+        await rds.set("noreply:1", "1")
+
+        assert await rds.flushdb(noreply=True) is None
+        assert await rds.get("noreply:1") is None
+
+
+async def test_lmove(redis: Redis):
+    await redis.rpush("list:1", "a", "b", "c")
+
+    moved = await redis.lmove("list:1", "list:2", source_right=True, destination_left=True)
+    assert moved == b"c"
+    moved = await redis.lmove("list:1", "list:2", source_left=True, destination_left=True)
+    assert moved == b"a"
+    assert await redis.lrange("list:2", 0, -1) == [b"a", b"c"]
+
+    with pytest.raises(ValueError):
+        await redis.lmove("list:1", "list:2", source_left=True)
+
+
+async def test_push1(redis: Redis):
+    assert await redis.rpush1("list:3", "b") == 1
+    assert await redis.lpush1("list:3", "a") == 2
+    assert await redis.lrange("list:3", 0, -1) == [b"a", b"b"]
+
+
+async def test_set_expiration(redis: Redis):
+    assert await redis.set("str:1", "1", ex=100) == b"OK"
+    assert 0 < await redis.ttl("str:1") <= 100
+    assert await redis.getex("str:1", persist=True) == b"1"
+    assert await redis.ttl("str:1") == -1
+
+    assert await redis.mset(("str:2", "2"), ("str:3", "3")) == b"OK"
+    assert await redis.mget("str:2", "str:3") == [b"2", b"3"]
+
+
+async def test_mget_mset_many(redis: Redis):
+    keys = [f"many:{i}" for i in range(450)]
+
+    assert [b"OK"] * 3 == await redis.mset_many(*((k, k) for k in keys), chunk=200)
+    assert await redis.mget_many([*keys, "many:x"], chunk=100) == [
+        *(k.encode() for k in keys),
+        None,
+    ]
+
+
+async def test_zadd_score(redis: Redis):
+    assert await redis.script_load(_ZADD_SCORE.source) == _ZADD_SCORE.sha
+
+    assert await redis.zadd_score("zadd:2", 5, "a") == 5.0
+    assert await redis.zadd_score("zadd:2", 3, "a", gt=True) == 5.0
+    assert await redis.zadd_score("zadd:2", 7.5, "a", gt=True) == 7.5
+    assert await redis.zadd_score("zadd:2", 1, "b", xx=True) is None
+
+
+async def test_zrange_withscores(redis: Redis):
+    await redis.zadd("zrange:1", 1, "a", 2.5, "b")
+    expected = [(b"a", 1.0), (b"b", 2.5)]
+
+    assert await redis.zrange_withscores("zrange:1", 0, -1) == expected
+
+    async with Redis.from_addr("127.0.0.1", 63790, hello=Hello(version=2)) as rds:
+        assert await rds.zrange_withscores("zrange:1", 0, -1) == expected
+        assert await rds.zrange_withscores("zrange:x", 0, -1) == []
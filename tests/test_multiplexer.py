@@ -0,0 +1,18 @@
+import trio
+
+from redislib import Redis
+
+
+async def test_concurrent_commands(redis: Redis):
+    replies = {}
+
+    async def _incr(rds: Redis, i: int):
+        replies[i] = await rds.incr("mux:counter")
+
+    async with Redis.from_addr("127.0.0.1", 63790, multiplex=True) as rds:
+        async with trio.open_nursery() as nursery:
+            for i in range(100):
+                nursery.start_soon(_incr, rds, i)
+
+        assert sorted(replies.values()) == list(range(1, 101))
+        assert await rds.get("mux:counter") == b"100"
@@ -0,0 +1,66 @@
+from enum import IntEnum
+
+from respy3 import write_command
+
+from redislib.connection import (
+    _pack_cmd,
+    _pack_cmd_seq,
+    encode_key,
+    pack_cmd,
+    pack_cmd_seq,
+    pack_prebuilt,
+    pack_prefix,
+)
+
+
+def test_pack_cmd():
+    args = (b"key", "välue", 0, 7, 1023, 1024, -1, 1.5, bytearray(b"ba"))
+    expected = write_command(b"SET", *(str(a).encode() for a in args[2:-1]))
+
+    packed = pack_cmd(b"SET", *args)
+
+    assert packed.startswith(b"*10\r\n$3\r\nSET\r\n$3\r\nkey\r\n$6\r\nv\xc3\xa4lue\r\n")
+    assert packed.endswith(b"$2\r\nba\r\n")
+    assert expected[len(b"*8\r\n$3\r\nSET\r\n") :] in packed
+
+
+def test_pack_prebuilt():
+    prefix = pack_prefix(b"HGET", 2)
+
+    assert pack_prebuilt(prefix, "key", 1) == pack_cmd(b"HGET", "key", 1)
+    assert pack_prebuilt(pack_prefix(b"PING", 0)) == pack_cmd(b"PING")
+
+
+def test_pack_cmd_many_args():
+    pairs = [(f"field:{i}", f"välue:{i}".encode()) for i in range(1000)]
+    args = ["key", *(arg for pair in pairs for arg in pair)]
+
+    packed = pack_cmd(b"HSET", *args)
+
+    assert packed == _pack_cmd(b"HSET", *args)
+    assert packed == pack_cmd_seq(b"HSET", args) == _pack_cmd_seq(b"HSET", args)
+    assert packed.startswith(b"*2002\r\n$4\r\nHSET\r\n$3\r\nkey\r\n$7\r\nfield:0\r\n")
+
+
+def test_encode_key():
+    key = encode_key("këy")
+
+    assert key == "këy".encode() and encode_key(key) is key
+    assert pack_cmd(b"LLEN", key) == pack_cmd(b"LLEN", "këy")
+
+
+def test_pack_numbers():
+    args = (-17, 2**70, 0.1, -2.5e-300, float("inf"))
+
+    assert _pack_cmd(b"ZADD", *args) == write_command(
+        b"ZADD", *(str(a).encode() for a in args)
+    )
+
+
+def test_pack_int_subclass():
+    class Level(IntEnum):
+        HIGH = 9
+
+    assert _pack_cmd(b"INCRBY", b"k", Level.HIGH) == write_command(
+        b"INCRBY", b"k", b"9"
+    )
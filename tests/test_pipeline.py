@@ -0,0 +1,102 @@
+import pytest
+import trio
+
+from redislib import Redis
+from redislib.connection import _SENDMSG_MIN_FRAMES, Connection, pack_cmd
+
+
+async def test_pipeline(redis: Redis):
+    async with redis.pipeline() as pipe:
+        await pipe.hset("pipe:1", ("f1", "v1"), ("f2", "v2"))
+        await pipe.expire("pipe:1", 60)
+        await pipe.hget("pipe:1", "f2")
+
+        assert [2, 1, b"v2"] == await pipe.execute()
+        assert [] == await pipe.execute()
+
+
+async def test_pipeline_without_execute(redis: Redis):
+    with pytest.raises(RuntimeError) as err:
+        async with redis.pipeline() as pipe:
+            await pipe.set("pipe:2", "2")
+
+    assert err.value.args[0] == "unexecuted commands left in pipeline"
+
+
+async def test_pipeline_many_commands(redis: Redis):
+    async with redis.pipeline() as pipe:
+        for i in range(2000):
+            await pipe.set(f"pipe:3:{i}", "x" * i)
+        await pipe.get("pipe:3:1999")
+
+        replies = await pipe.execute()
+
+    assert replies[:-1] == [b"OK"] * 2000
+    assert replies[-1] == b"x" * 1999
+
+
+async def test_pipeline_pending_replies(redis: Redis):
+    async with redis.pipeline() as pipe:
+        incr = pipe.queue(b"INCR", "pipe:4")
+        get = await pipe.get("pipe:4")
+        assert not get.done
+
+        await pipe.execute()
+
+    assert (incr.done, get.done) == (True, True)
+    assert get.value == str(incr.value).encode()
+
+
+async def test_pipeline_transaction(redis: Redis):
+    async with redis.pipeline(transaction=True) as pipe:
+        await pipe.set("pipe:5", "1")
+        incr = await pipe.incr("pipe:5")
+        await pipe.expire("pipe:5", 60)
+
+        assert [b"OK", 2, 1] == await pipe.execute()
+
+    assert incr.value == 2
+
+
+async def test_push_many(redis: Redis):
+    await redis.del_("pipe:6:1", "pipe:6:2")
+
+    assert [2, 1] == await redis.rpush_many(
+        ("pipe:6:1", ["a", "b"]), ("pipe:6:2", ["c"])
+    )
+    assert [3] == await redis.lpush_many(("pipe:6:1", ["z"]))
+    assert await redis.lrange("pipe:6:1", 0, -1) == [b"z", b"a", b"b"]
+
+
+async def test_pipeline_multi_exec(redis: Redis):
+    async with redis.pipeline() as pipe:
+        await pipe.multi()
+        await pipe.set("pipe:7", "1")
+        await pipe.incr("pipe:7")
+        exec_ = await pipe.exec()
+        await pipe.get("pipe:7")
+
+        assert [b"OK", b"QUEUED", b"QUEUED", [b"OK", 2], b"2"] == await pipe.execute()
+
+    assert exec_.value == [b"OK", 2]
+
+
+async def test_send_frames_to_closed_peer():
+    async def _close(stream):
+        await stream.aclose()
+
+    async with trio.open_nursery() as nursery:
+        listeners = await nursery.start(trio.serve_tcp, _close, 0)
+        port = listeners[0].socket.getsockname()[1]
+
+        sock = await trio.open_tcp_stream("127.0.0.1", port)
+        conn = Connection(sock, said_hello=True)
+        frames = [pack_cmd(b"PING")] * (_SENDMSG_MIN_FRAMES + 1)
+
+        # the first sends may be taken by the kernel before the reset
+        with pytest.raises(trio.BrokenResourceError):
+            for _ in range(100):
+                await conn.send_frames(frames)
+                await trio.sleep(0.01)
+
+        nursery.cancel_scope.cancel()
@@ -0,0 +1,84 @@
+import trio
+from trio.testing import wait_all_tasks_blocked
+
+from redislib import Redis
+
+
+async def test_pool_reuses_recent_conn():
+    async with Redis.from_addr("127.0.0.1", 63790, pool_size=2) as rds:
+        pool = rds._pool
+
+        first = await pool.acquire()
+        second = await pool.acquire()
+        await pool.release(first)
+        await pool.release(second)
+        # a double release is ignored
+        await pool.release(second)
+
+        assert await pool.acquire() is second
+        assert await pool.acquire() is first
+        await pool.release(first)
+        await pool.release(second)
+
+
+async def test_pool_waits_for_release():
+    async with Redis.from_addr("127.0.0.1", 63790, pool_size=1) as rds:
+        async with trio.open_nursery() as nursery:
+            for i in range(10):
+                nursery.start_soon(rds.incr, "pool:1")
+
+        assert await rds.get("pool:1") == b"10"
+        assert len(rds._pool._conns) == 1
+        await rds.del_("pool:1")
+
+
+async def test_pool_discards_interrupted_conn():
+    async with Redis.from_addr("127.0.0.1", 63790, pool_size=1) as rds:
+        await rds.set("pool:2", "1")
+        conn = rds._pool._conns[0]
+
+        with trio.CancelScope() as scope:
+            scope.cancel()
+            await rds.get("pool:2")
+
+        assert conn not in rds._pool._conns
+        assert await rds.get("pool:2") == b"1"
+        await rds.del_("pool:2")
+
+
+async def _cancel_when_blocked(fn, *args):
+    """run fn, and cancel it once it waits for the replies"""
+    async with trio.open_nursery() as nursery:
+        nursery.start_soon(fn, *args)
+        await wait_all_tasks_blocked()
+        nursery.cancel_scope.cancel()
+
+
+async def test_pool_discards_cancelled_pipeline():
+    async with Redis.from_addr("127.0.0.1", 63790, pool_size=1) as rds:
+        await rds.mset(("pool:3", "a"), ("pool:4", "b"))
+
+        async def _execute():
+            async with rds.pipeline() as pipe:
+                for _ in range(5000):
+                    pipe.queue(b"GET", "pool:3")
+                await pipe.execute()
+
+        await _cancel_when_blocked(_execute)
+
+        assert await rds.get("pool:4") == b"b"
+        await rds.del_("pool:3", "pool:4")
+
+
+async def test_pool_discards_cancelled_connection():
+    async with Redis.from_addr("127.0.0.1", 63790, pool_size=1) as rds:
+        await rds.mset(("pool:5", "a" * (2 << 20)), ("pool:6", "b"))
+
+        async def _get():
+            async with rds.connection() as conn:
+                await conn.get("pool:5")
+
+        await _cancel_when_blocked(_get)
+
+        assert await rds.get("pool:6") == b"b"
+        await rds.del_("pool:5", "pool:6")
@@ -0,0 +1,86 @@
+import pytest
+from respy3.protocol import RedisError
+
+from redislib import Redis
+from redislib.protocol import HiredisReader, Reader
+
+try:
+    import hiredis
+except ImportError:
+    hiredis = None
+
+readers = pytest.mark.parametrize(
+    "new_reader",
+    [
+        Reader,
+        pytest.param(
+            HiredisReader,
+            marks=pytest.mark.skipif(hiredis is None, reason="needs hiredis"),
+        ),
+    ],
+)
+
+
+@readers
+def test_reader_resumes(new_reader):
+    data = b"*3\r\n$5\r\nhello\r\n%1\r\n+k\r\n:1\r\n-ERR oops\r\n_\r\n"
+    reader = new_reader()
+
+    for i in range(len(data)):
+        reader.feed(data[i : i + 1])
+        reply = reader.get_object()
+        if reply is not reader.sentinel:
+            break
+
+    assert reply[:2] == [b"hello", {b"k": 1}]
+    assert isinstance(reply[2], RedisError)
+
+    assert reader.get_object() is reader.sentinel
+    reader.feed(data[i + 1 :])
+    assert reader.get_object() is None
+
+
+@readers
+def test_reader_get_objects(new_reader):
+    reader = new_reader()
+    reader.feed(b"+OK\r\n:1\r\n$5\r\nhel")
+
+    assert reader.get_objects(3) == [b"OK", 1]
+    reader.feed(b"lo\r\n_\r\n")
+    assert reader.get_objects(1) == [b"hello"]
+    assert reader.get_objects(3) == [None]
+    assert reader.get_objects(3) == []
+
+
+def test_hiredis_reader():
+    pytest.importorskip("hiredis")
+
+    data = b"*2\r\n$5\r\nhello\r\n%1\r\n+k\r\n,1.5\r\n-NOSCRIPT no script\r\n"
+    reader = HiredisReader()
+
+    reader.feed(data[:10])
+    assert reader.get_objects(2) == []
+    reader.feed(data[10:])
+    reply, error = reader.get_objects(2)
+
+    assert reply == [b"hello", {b"k": 1.5}]
+    assert isinstance(error, RedisError)
+    assert error == RedisError(b"NOSCRIPT", b"no script")
+    assert reader.get_object() is reader.sentinel
+
+
+@readers
+def test_reader_feed_part(new_reader):
+    rx = bytearray(b"xx+OK\r\n:1\r\nyy")
+    reader = new_reader()
+
+    reader.feed(rx, 2, 9)
+    assert reader.get_objects(3) == [b"OK", 1]
+
+
+@readers
+async def test_redis_with_reader(new_reader):
+    async with Redis.from_addr("127.0.0.1", 63790, reader=new_reader) as redis:
+        await redis.hset("reader:1", ("f", "v"))
+        assert await redis.hgetall("reader:1") == {b"f": b"v"}
+        assert await redis.del_("reader:1") == 1
@@ -1,6 +1,10 @@
 import string
+from contextlib import aclosing
 
-from redislib import SCAN, PairedZSCAN, Redis
+import trio
+from trio.testing import wait_all_tasks_blocked
+
+from redislib import HSCAN, SCAN, PairedZSCAN, Redis
 
 
 async def test_scan(redis: Redis):
@@ -17,3 +21,46 @@ async def test_sscan(redis: Redis):
 
     scanner = PairedZSCAN(redis, 'letters')
     assert set([letter.decode() async for (letter, _) in scanner]) == set(string.ascii_lowercase)
+
+
+async def test_hscan_order(redis: Redis):
+    await redis.hset("hscan:1", ("f1", "v1"))
+
+    assert [one async for one in HSCAN(redis, "hscan:1")] == [b"f1", b"v1"]
+
+
+async def test_scan_batches(redis: Redis):
+    await redis.mset(*((char, char) for char in string.ascii_letters))
+
+    batches = [keys async for keys in SCAN(redis, count=10).batches()]
+    assert sorted(key for keys in batches for key in keys) == sorted(
+        char.encode() for char in string.ascii_letters
+    )
+
+
+async def test_scan_prefetch(redis: Redis):
+    await redis.mset(*((char, char) for char in string.ascii_letters))
+
+    async with trio.open_nursery() as nursery:
+        scanner = SCAN(redis, count=5, nursery=nursery)
+        keys = [one async for one in scanner]
+
+    assert sorted(keys) == sorted(char.encode() for char in string.ascii_letters)
+
+
+async def test_scan_prefetch_break(redis: Redis):
+    await redis.mset(*((char, char) for char in string.ascii_letters))
+
+    async with trio.open_nursery() as nursery:
+        scanner = SCAN(redis, count=5, nursery=nursery)
+
+        async with aclosing(scanner.batches()) as batches:
+            async for _ in batches:
+                # let the prefetch go
+                await wait_all_tasks_blocked()
+                break
+
+        assert scanner._prefetch_scope.cancel_called
+
+    assert not redis._pool._acquired
+    assert await redis.get("a") == b"a"
@@ -1,4 +1,5 @@
 import pytest
+import trio
 from redislib import Redis
 
 
@@ -20,3 +21,62 @@ async def test_tx_without_exec(redis: Redis):
             await tx.set("tx:2:2", '2:2', nx=True)
 
     assert err.value.args[0] == "unmatched transaction acquiring and releasing"
+
+
+async def test_tx_without_exec_discarded():
+    async with Redis.from_addr("127.0.0.1", 63790, pool_size=1) as rds:
+        with pytest.raises(RuntimeError):
+            async with rds.open_transaction() as tx:
+                await tx.multi()
+                await tx.set("tx:3", "3")
+
+        assert await rds.get("tx:3") is None
+
+
+async def test_transaction(redis: Redis):
+    async def _incr_expire(pipe):
+        await pipe.incr("tx:4")
+        await pipe.expire("tx:4", 60)
+
+    await redis.del_("tx:4")
+    assert [1, 1] == await redis.transaction(_incr_expire)
+    assert [2, 1] == await redis.transaction(_incr_expire)
+
+
+async def test_buffered_tx(redis: Redis):
+    await redis.set("tx:5", "1")
+
+    async with redis.open_transaction(buffered=True) as tx:
+        await tx.watch("tx:5")
+        assert await tx.get("tx:5") == b"1"
+
+        multi = await tx.multi()
+        incr = await tx.incr("tx:5")
+        assert not incr.done
+
+        assert [2] == await tx.exec()
+
+    assert (multi.value, incr.value) == (b"OK", b"QUEUED")
+
+
+async def test_buffered_tx_without_exec():
+    async with Redis.from_addr("127.0.0.1", 63790, pool_size=1) as rds:
+        with pytest.raises(RuntimeError):
+            async with rds.open_transaction(buffered=True) as tx:
+                await tx.multi()
+                await tx.set("tx:6", "6")
+
+        assert await rds.get("tx:6") is None
+
+
+async def test_cancelled_tx_discarded():
+    async with Redis.from_addr("127.0.0.1", 63790, pool_size=1) as rds:
+        with trio.CancelScope() as scope:
+            async with rds.open_transaction() as tx:
+                await tx.multi()
+                scope.cancel()
+                await tx.set("tx:7", "7")
+
+        # not QUEUED in the MULTI of the cancelled transaction
+        assert await rds.set("tx:7", "7") == b"OK"
+        await rds.del_("tx:7")